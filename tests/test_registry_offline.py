@@ -0,0 +1,401 @@
+#!/usr/bin/env python3
+"""
+Registry tests that run without a Neo4j server, using a recording fake driver.
+"""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from neo4j.exceptions import ClientError
+
+from yaml2graph.registry import loaders, writers
+from yaml2graph.registry.factory import RegistryFactory
+from yaml2graph.registry.loaders import RegistryLoader
+from yaml2graph.scripts.stamp import registry_digest
+
+REGISTRY_PATH = Path(__file__).parent.parent / "yaml2graph" / "config" / "main_registry.yaml"
+
+
+class FakeResult:
+    """Result stand-in with no records"""
+
+    records = []
+
+    def consume(self):
+        return None
+
+    def single(self):
+        return None
+
+    def __iter__(self):
+        return iter([])
+
+
+class FakeTransaction:
+    """Records every statement, commit and rollback into a shared log"""
+
+    # Statements starting with one of these prefixes are logged, then rejected by the "server"
+    fail_on = ()
+
+    def __init__(self, log):
+        self.log = log
+
+    def run(self, query, parameters=None, **kwargs):
+        query = " ".join(query.split())
+        self.log.append(("run", query, dict(parameters or {}, **kwargs)))
+        if query.startswith(self.fail_on):
+            raise ClientError(f"rejected: {query}")
+        return FakeResult()
+
+    def commit(self):
+        self.log.append(("commit",))
+
+    def rollback(self):
+        self.log.append(("rollback",))
+
+    def close(self):
+        pass
+
+
+class FakeSession(FakeTransaction):
+    """Session stand-in; managed writes run their work on a recording transaction"""
+
+    def execute_write(self, work, *args, **kwargs):
+        return work(FakeTransaction(self.log), *args, **kwargs)
+
+    def begin_transaction(self):
+        return FakeTransaction(self.log)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class FakeDriver:
+    """Driver stand-in that logs session opens and managed queries"""
+
+    def __init__(self):
+        self.log = []
+
+    def session(self, **kwargs):
+        self.log.append(("session",))
+        return FakeSession(self.log)
+
+    def execute_query(self, query, parameters_=None, routing_=None, **kwargs):
+        self.log.append(("run", " ".join(query.split()), dict(parameters_ or {})))
+        return FakeResult()
+
+    def close(self):
+        pass
+
+
+class WriterTestCase(unittest.TestCase):
+    """Builds a writer from the shipped registry on top of a FakeDriver"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.factory = RegistryFactory(str(REGISTRY_PATH))
+
+    def setUp(self):
+        self.driver = FakeDriver()
+        with patch.object(writers.GraphDatabase, "driver", return_value=self.driver):
+            self.writer = self.factory.create_writer("bolt://fake", "neo4j", "password")
+
+    def statements(self, prefix):
+        """Parameters of every logged statement whose Cypher starts with prefix, in order"""
+        return [entry[2] for entry in self.driver.log if entry[0] == "run" and entry[1].startswith(prefix)]
+
+    def position(self, prefix):
+        """Index in the log of the first statement starting with prefix"""
+        return next(i for i, entry in enumerate(self.driver.log) if entry[0] == "run" and entry[1].startswith(prefix))
+
+
+class TestEntityBatchUpsert(WriterTestCase):
+    """Tests for the generated upsert_<entity>_batch methods"""
+
+    def test_duplicate_urns_are_folded_into_one_row(self):
+        urns = self.writer.upsert_tag_batch([
+            {"key": "pii"},
+            {"key": "pii", "value": None},
+            {"key": "gdpr"},
+        ])
+
+        self.assertEqual(urns, ["urn:li:tag:pii", "urn:li:tag:pii", "urn:li:tag:gdpr"])
+        (merge,) = self.statements("UNWIND $rows AS row MERGE (e:Tag")
+        self.assertEqual(merge["rows"], [
+            {"urn": "urn:li:tag:pii", "props": {"key": "pii"}},
+            {"urn": "urn:li:tag:gdpr", "props": {"key": "gdpr"}},
+        ])
+
+    def test_rows_are_split_into_batch_size_chunks_in_order(self):
+        with patch.object(writers, "BATCH_SIZE", 2):
+            self.writer.upsert_tag_batch([{"key": f"t{i}"} for i in range(5)])
+
+        merges = self.statements("UNWIND $rows AS row MERGE (e:Tag")
+        self.assertEqual([row["urn"] for m in merges for row in m["rows"]],
+                         [f"urn:li:tag:t{i}" for i in range(5)])
+        self.assertEqual([len(m["rows"]) for m in merges], [2, 2, 1])
+
+    def test_max_workers_writes_every_chunk(self):
+        with patch.object(writers, "BATCH_SIZE", 2):
+            self.writer.upsert_tag_batch([{"key": f"t{i}"} for i in range(5)], max_workers=3)
+
+        merges = self.statements("UNWIND $rows AS row MERGE (e:Tag")
+        self.assertEqual(sorted(len(m["rows"]) for m in merges), [1, 2, 2])
+        written = sorted(row["urn"] for m in merges for row in m["rows"])
+        self.assertEqual(written, sorted(f"urn:li:tag:t{i}" for i in range(5)))
+
+    def test_atomicity_is_decided_on_folded_urns(self):
+        with patch.object(writers, "BATCH_SIZE", 2):
+            self.writer.upsert_tag_batch([{"key": "pii"}, {"key": "gdpr"}, {"key": "pii"}, {"key": "gdpr"}])
+
+        (merge,) = self.statements("UNWIND $rows AS row MERGE (e:Tag")
+        self.assertEqual(len(merge["rows"]), 2)
+        self.assertEqual(self.driver.log.count(("commit",)), 1)
+        self.assertEqual(self.driver.log[-1], ("commit",))
+
+    def test_single_chunk_commits_nodes_then_relationships_once(self):
+        self.writer.upsert_column_batch([
+            {"dataset_urn": "urn:d", "field_path": "a"},
+            {"dataset_urn": "urn:d", "field_path": "b"},
+        ])
+
+        nodes = self.position("UNWIND $rows AS row MERGE (e:Column")
+        relationships = self.position("UNWIND $rows AS row MATCH (a:Dataset")
+        self.assertLess(nodes, relationships)
+        (has_column,) = self.statements("UNWIND $rows AS row MATCH (a:Dataset")
+        self.assertEqual([row["target_urn"] for row in has_column["rows"]],
+                         ["urn:li:column:(urn:d,a)", "urn:li:column:(urn:d,b)"])
+        self.assertEqual(self.driver.log.count(("commit",)), 1)
+        self.assertEqual(self.driver.log[-1], ("commit",))
+
+
+class TestVersionedAspectBatch(WriterTestCase):
+    """Tests for the generated upsert_<aspect>_aspect_batch methods of versioned aspects"""
+
+    def test_repeated_urns_are_written_in_later_rounds(self):
+        self.writer.upsert_datasetproperties_aspect_batch("Dataset", [
+            {"entity_urn": "urn:d1", "payload": {"description": "first"}},
+            {"entity_urn": "urn:d2", "payload": {"description": "other"}, "version": 7},
+            {"entity_urn": "urn:d1", "payload": {"description": "second"}},
+            {"entity_urn": "urn:d1", "payload": {"description": "third"}},
+        ])
+
+        rounds = self.statements("UNWIND $rows AS row MATCH (e:Dataset")
+        self.assertEqual([[row["urn"] for row in r["rows"]] for r in rounds],
+                         [["urn:d1", "urn:d2"], ["urn:d1"], ["urn:d1"]])
+        self.assertEqual([row["version"] for row in rounds[0]["rows"]], [None, 7])
+        self.assertEqual([r["rows"][0]["json"] for r in rounds[1:]],
+                         ['{"description":"second"}', '{"description":"third"}'])
+
+
+class TestVersionedAspectLatestFlag(WriterTestCase):
+    """Tests that a new version clears latest on any existing aspect node, not only :Versioned ones"""
+
+    def assert_clears_latest_on_any_aspect(self, query):
+        self.assertIn("OPTIONAL MATCH (e)-[r:HAS_ASPECT {name:$an}]->(old:Aspect) ", query)
+        self.assertIn("max(CASE WHEN old:Versioned THEN old.version END)", query)
+        self.assertIn("collect(CASE WHEN r.kind = 'versioned' AND r.latest THEN r END) AS latest "
+                      "FOREACH (r IN latest | SET r.latest=false)", query)
+
+    def test_single_upsert(self):
+        self.writer.upsert_datasetproperties_aspect("Dataset", "urn:d1", {"description": "new"})
+
+        (query,) = [entry[1] for entry in self.driver.log if entry[0] == "run" and "HAS_ASPECT" in entry[1]]
+        self.assert_clears_latest_on_any_aspect(query)
+
+    def test_batch_upsert(self):
+        self.writer.upsert_datasetproperties_aspect_batch("Dataset", [
+            {"entity_urn": "urn:d1", "payload": {"description": "new"}},
+        ])
+
+        (query,) = [entry[1] for entry in self.driver.log if entry[0] == "run" and "HAS_ASPECT" in entry[1]]
+        self.assert_clears_latest_on_any_aspect(query)
+
+
+class TestRelationshipBatching(WriterTestCase):
+    """Tests for the pending relationship map and its UNWIND flush"""
+
+    def test_repeated_pairs_are_written_once(self):
+        self.writer.upsert_column_batch([
+            {"dataset_urn": "urn:d", "field_path": "a"},
+            {"dataset_urn": "urn:d", "field_path": "a"},
+            {"dataset_urn": "urn:d", "field_path": "b"},
+        ])
+
+        (has_column,) = self.statements("UNWIND $rows AS row MATCH (a:Dataset")
+        self.assertEqual([row["target_urn"] for row in has_column["rows"]],
+                         ["urn:li:column:(urn:d,a)", "urn:li:column:(urn:d,b)"])
+
+    def test_first_row_of_a_pair_wins_and_only_sets_props_on_create(self):
+        self.writer._merge_relationships_generic("Dataset", "HAS_COLUMN", "Column", [
+            {"source_urn": "urn:d", "target_urn": "urn:c", "props": {"order": 1}},
+            {"source_urn": "urn:d", "target_urn": "urn:c", "props": {"order": 2}},
+        ])
+
+        (query, params) = next(entry[1:] for entry in self.driver.log if entry[0] == "run")
+        self.assertEqual(params["rows"], [{"source_urn": "urn:d", "target_urn": "urn:c", "props": {"order": 1}}])
+        # Existing relationships keep their properties: nothing is set when the MERGE matches
+        self.assertTrue(query.endswith("MERGE (a)-[r:HAS_COLUMN]->(b) ON CREATE SET r += row.props"))
+        self.assertNotIn("ON MATCH", query)
+
+    def test_caller_pending_map_defers_the_flush(self):
+        pending = {}
+        self.writer.discover_relationships_from_entity("Column", "urn:li:column:(urn:d,a)",
+                                                       {"dataset_urn": "urn:d", "field_path": "a"}, pending)
+
+        self.assertEqual(self.statements("UNWIND $rows AS row MATCH"), [])
+        self.assertEqual([row["source_urn"] for rows in pending.values() for row in rows], ["urn:d"])
+
+
+class TestCreateIndexes(WriterTestCase):
+    """Tests for create_indexes and its fallbacks"""
+
+    def test_constraints_are_created_for_every_entity(self):
+        self.writer.create_indexes()
+
+        constraints = [entry[1] for entry in self.driver.log if entry[0] == "run" and entry[1].startswith("CREATE CONSTRAINT")]
+        self.assertIn("CREATE CONSTRAINT IF NOT EXISTS FOR (n:Dataset) REQUIRE n.urn IS UNIQUE", constraints)
+        self.assertEqual(self.statements("CREATE INDEX IF NOT EXISTS FOR (n:Dataset) ON (n.urn)"), [])
+
+    def test_rejected_constraint_falls_back_to_an_index(self):
+        with patch.object(FakeTransaction, "fail_on", ("CREATE CONSTRAINT",)):
+            self.writer.create_indexes()
+
+        queries = [entry[1] for entry in self.driver.log if entry[0] == "run"]
+        constraint = queries.index("CREATE CONSTRAINT IF NOT EXISTS FOR (n:Dataset) REQUIRE n.urn IS UNIQUE")
+        self.assertEqual(queries[constraint + 1], "CREATE INDEX IF NOT EXISTS FOR (n:Dataset) ON (n.urn)")
+
+    def test_rejected_index_is_skipped(self):
+        with patch.object(FakeTransaction, "fail_on", ("CREATE",)):
+            self.writer.create_indexes()
+
+        self.assertTrue(self.statements("CREATE INDEX IF NOT EXISTS FOR (n:Dataset) ON (n.urn)"))
+
+
+class TestCheckpointedTransaction(WriterTestCase):
+    """Tests for transaction(commit_every=...)"""
+
+    def test_yielded_handle_follows_checkpoints(self):
+        with self.writer.transaction(commit_every=2) as tx:
+            for i in range(3):
+                tx.run("RETURN $i", i=i)
+
+        entries = [entry if entry[0] != "run" else entry[2]["i"] for entry in self.driver.log[1:]]
+        self.assertEqual(entries, [0, 1, ("commit",), 2, ("commit",)])
+
+
+class TestParsedYamlCache(unittest.TestCase):
+    """Tests for the parsed-YAML cache behind RegistryLoader._load_yaml_file"""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = os.path.join(tmp.name, "registry.yaml")
+        with open(self.path, "w") as f:
+            f.write("entities:\n  Dataset:\n    properties: [name]\n")
+        self.loader = RegistryLoader(self.path)
+
+    def test_editing_the_file_invalidates_the_cache(self):
+        self.assertEqual(self.loader._load_yaml_file(self.path)["entities"]["Dataset"]["properties"], ["name"])
+        mtime_ns = os.stat(self.path).st_mtime_ns
+
+        with open(self.path, "w") as f:
+            f.write("entities:\n  Dataset:\n    properties: [name, env]\n")
+        # Coarse filesystem timestamps could leave mtime unchanged within one tick
+        os.utime(self.path, ns=(mtime_ns + 1_000_000_000, mtime_ns + 1_000_000_000))
+
+        self.assertEqual(self.loader._load_yaml_file(self.path)["entities"]["Dataset"]["properties"], ["name", "env"])
+
+    def test_same_size_edit_with_new_mtime_invalidates_the_cache(self):
+        self.assertEqual(self.loader._load_yaml_file(self.path)["entities"]["Dataset"]["properties"], ["name"])
+        mtime_ns = os.stat(self.path).st_mtime_ns
+
+        with open(self.path, "w") as f:
+            f.write("entities:\n  Dataset:\n    properties: [nick]\n")
+        os.utime(self.path, ns=(mtime_ns + 1_000_000_000, mtime_ns + 1_000_000_000))
+
+        self.assertEqual(self.loader._load_yaml_file(self.path)["entities"]["Dataset"]["properties"], ["nick"])
+
+    def test_mutating_a_result_leaves_the_cache_untouched(self):
+        first = self.loader._load_yaml_file(self.path)
+        first["entities"]["Dataset"]["properties"].append("mutated")
+        first["entities"]["Chart"] = {}
+
+        second = self.loader._load_yaml_file(self.path)
+        self.assertEqual(second, {"entities": {"Dataset": {"properties": ["name"]}}})
+        self.assertEqual(len([key for key in loaders._PARSED_YAML_CACHE if key[0] == os.path.realpath(self.path)]), 1)
+
+
+class TestRegistryDigest(unittest.TestCase):
+    """Tests that the generation stamp follows the registry and its includes"""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        root = Path(tmp.name)
+        (root / "registry").mkdir()
+        (root / "shared").mkdir()
+        self.inside = root / "registry" / "entities.yaml"
+        self.outside = root / "shared" / "aspects.yaml"
+        self.inside.write_text("entities: {}\n")
+        self.outside.write_text("aspects: {}\n")
+        self.registry = root / "registry" / "main_registry.yaml"
+        self.registry.write_text("includes:\n  - entities.yaml\n  - ../shared/aspects.yaml\n")
+
+    def test_editing_an_include_changes_the_digest(self):
+        for include in (self.inside, self.outside):
+            with self.subTest(include=include.name):
+                before = registry_digest(str(self.registry), [])
+                include.write_text(include.read_text() + "# edited\n")
+                self.assertNotEqual(registry_digest(str(self.registry), []), before)
+
+    def test_unchanged_files_keep_the_digest(self):
+        self.assertEqual(registry_digest(str(self.registry), []), registry_digest(str(self.registry), []))
+
+
+class TestURNGeneratorMemoization(unittest.TestCase):
+    """Tests for the lru_cache in front of each URN generator"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.generators = RegistryFactory(str(REGISTRY_PATH)).urn_generators
+
+    def setUp(self):
+        for generator in self.generators.values():
+            generator.cache_clear()
+
+    def test_cached_output_matches_uncached(self):
+        cases = {
+            "dataset": {"platform": "mysql", "name": "db.orders", "env": "PROD"},
+            "corpUser": {"username": "jane@example.com"},
+            "tag": {"key": "pii", "value": None},
+            "column": {"dataset_urn": "urn:li:dataset:(urn:li:dataPlatform:mysql,db.orders,PROD)", "field_path": "id"},
+        }
+        for name, kwargs in cases.items():
+            with self.subTest(generator=name):
+                generator = self.generators[name]
+                first, second = generator(**kwargs), generator(**kwargs)
+                self.assertEqual(first, generator.__wrapped__(**kwargs))
+                self.assertEqual(second, first)
+                self.assertEqual(generator.cache_info().hits, 1)
+
+    def test_non_string_kwargs_bypass_cache(self):
+        generator = self.generators["dataset"]
+        for value in (1, True, 1.5, {"nested": "dict"}):
+            with self.subTest(value=value):
+                result = generator(platform="mysql", name=value, env="PROD")
+                self.assertEqual(result, generator.__wrapped__(platform="mysql", name=value, env="PROD"))
+        self.assertEqual(generator.cache_info().currsize, 0)
+        self.assertEqual(generator.cache_info().misses, 0)
+        # 1 and True compare equal, so caching them would hand one the other's URN
+        self.assertNotEqual(generator(platform="mysql", name=1), generator(platform="mysql", name=True))
+
+
+if __name__ == "__main__":
+    unittest.main()
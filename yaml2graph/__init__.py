@@ -12,9 +12,24 @@ from .utils.logging_config import setup_logging, get_logger
 # Initialize default logging
 setup_logging()
 
-from .registry.factory import RegistryFactory
-from .api_generator.generator import APIGenerator
-from .cli_generator.generator import CLIGenerator
+# Heavy submodules (neo4j driver, code generators) are imported on first access
+_LAZY_IMPORTS = {
+    "RegistryFactory": ".registry.factory",
+    "APIGenerator": ".api_generator.generator",
+    "CLIGenerator": ".cli_generator.generator",
+}
+
+
+def __getattr__(name):
+    """Resolve public classes lazily so importing a submodule stays cheap"""
+    module_path = _LAZY_IMPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(module_path, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "RegistryFactory",
@@ -66,6 +66,12 @@ class APIGenerator:
             sanitized = 'field_' + sanitized
         return sanitized
         
+    def _field_spec(self, field_name: str, sanitized_name: str, default: str) -> str:
+        """Render a field default, keeping a description only for renamed fields"""
+        if field_name == sanitized_name:
+            return "" if default == "..." else f" = {default}"
+        return f' = Field({default}, description="{field_name}")'
+        
     def generate_all(self):
         """Generate all FastAPI files"""
         log_function_call(self.logger, "generate_all")
@@ -119,23 +125,62 @@ class APIGenerator:
 Pydantic models for the generated API
 """
 
-from pydantic import BaseModel, Field
+from __future__ import annotations
+
+import sys
+from dataclasses import dataclass
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Any, Dict, List, Optional
 from datetime import datetime
 
 
+class APIModel(BaseModel):
+    """Base model that defers core-schema construction until first use"""
+    model_config = ConfigDict(defer_build=True)
+
+
+class APIRequest(APIModel):
+    """Base request model: immutable and rejecting unknown fields"""
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
+
+# Response DTOs are only built by the server, so they are plain dataclasses
+response_dto = dataclass(slots=True) if sys.version_info >= (3, 10) else dataclass
+
+
 # Health check models
-class HealthResponse(BaseModel):
+@response_dto
+class HealthResponse:
     """Health check response"""
-    status: str = Field(..., description="Service status")
-    registry_loaded: bool = Field(..., description="Registry loaded status")
-    available_entities: List[str] = Field(..., description="Available entity types")
-    available_aspects: List[str] = Field(..., description="Available aspect types")
-    available_utilities: List[str] = Field(..., description="Available utility functions")
+    status: str
+    registry_loaded: bool
+    available_entities: List[str]
+    available_aspects: List[str]
+    available_utilities: List[str]
+
+
+# Shared request models
+class EntityUrnRequest(APIRequest):
+    """Request model addressing an entity by URN"""
+    urn: str = Field(..., description="Entity URN")
+
+
+class AspectTargetRequest(APIRequest):
+    """Request model addressing an aspect on an entity"""
+    entity_label: str = Field(..., description="Entity label")
+    entity_urn: str = Field(..., description="Entity URN")
+
+
+class TimeseriesAspectGetRequest(AspectTargetRequest):
+    """Request model for reading a timeseries aspect"""
+    limit: Optional[int] = Field(100, description="Limit for timeseries aspects")
 
 
 # Entity models - generated dynamically from registry
 '''
+        # Names exported through __all__, recorded as each model is emitted
+        model_names = ["APIModel", "APIRequest", "HealthResponse", "EntityUrnRequest",
+                       "AspectTargetRequest", "TimeseriesAspectGetRequest"]
         
         # Generate entity models dynamically from registry
         entities = self.factory.registry.get('entities', {})
@@ -144,49 +189,45 @@ class HealthResponse(BaseModel):
             array_properties = entity_config.get('array_properties', [])
             
             # Generate upsert request model
+            model_names.append(f"{entity_name}UpsertRequest")
             models_content += f'''
-class {entity_name}UpsertRequest(BaseModel):
+class {entity_name}UpsertRequest(APIRequest):
     """Request model for upserting {entity_name} entity"""
 '''
             
             # Add entity-specific properties
             for prop in properties:
                 sanitized_prop = self._sanitize_field_name(prop)
+                field_spec = self._field_spec(prop, sanitized_prop, "None")
                 if prop in array_properties:
                     models_content += f'''
-    {sanitized_prop}: Optional[List[str]] = Field(None, description="{prop} (array)")'''
+    {sanitized_prop}: Optional[List[str]]{field_spec}'''
                 else:
                     models_content += f'''
-    {sanitized_prop}: Optional[str] = Field(None, description="{prop}")'''
+    {sanitized_prop}: Optional[str]{field_spec}'''
             
             models_content += f'''
     additional_properties: Optional[Dict[str, Any]] = Field(None, description="Additional {entity_name} properties")
 '''
             
-            # Generate get request model
-            models_content += f'''
-
-class {entity_name}GetRequest(BaseModel):
-    """Request model for getting {entity_name} entity"""
-    urn: str = Field(..., description="{entity_name} URN")
-'''
-            
-            # Generate delete request model
+            # Get and delete requests share one URN-only schema
+            model_names += [f"{entity_name}GetRequest", f"{entity_name}DeleteRequest"]
             models_content += f'''
 
-class {entity_name}DeleteRequest(BaseModel):
-    """Request model for deleting {entity_name} entity"""
-    urn: str = Field(..., description="{entity_name} URN")
+{entity_name}GetRequest = EntityUrnRequest
+{entity_name}DeleteRequest = EntityUrnRequest
 '''
             
             # Generate response model
+            model_names.append(f"{entity_name}Response")
             models_content += f'''
 
-class {entity_name}Response(BaseModel):
+@response_dto
+class {entity_name}Response:
     """Response model for {entity_name} entity"""
-    urn: str = Field(..., description="{entity_name} URN")
-    properties: Dict[str, Any] = Field(..., description="{entity_name} properties")
-    last_updated: Optional[datetime] = Field(None, description="Last updated timestamp")
+    urn: str
+    properties: Dict[str, Any]
+    last_updated: Optional[datetime] = None
 '''
         
         # Generate aspect models dynamically from registry
@@ -202,8 +243,9 @@ class {entity_name}Response(BaseModel):
             required_props = aspect_config.get('required', [])
             
             # Generate upsert request model
+            model_names.append(f"{aspect_name.title()}AspectUpsertRequest")
             models_content += f'''
-class {aspect_name.title()}AspectUpsertRequest(BaseModel):
+class {aspect_name.title()}AspectUpsertRequest(APIRequest):
     """Request model for upserting {aspect_name} aspect"""
     entity_label: Optional[str] = Field(None, description="Entity label (optional if entity_creation is configured)")
     entity_urn: Optional[str] = Field(None, description="Entity URN (optional if entity_creation is configured)")
@@ -214,10 +256,10 @@ class {aspect_name.title()}AspectUpsertRequest(BaseModel):
                 sanitized_prop = self._sanitize_field_name(prop)
                 if prop in required_props:
                     models_content += f'''
-    {sanitized_prop}: Any = Field(..., description="{prop}")'''
+    {sanitized_prop}: Any{self._field_spec(prop, sanitized_prop, "...")}'''
                 else:
                     models_content += f'''
-    {sanitized_prop}: Optional[Any] = Field(None, description="{prop}")'''
+    {sanitized_prop}: Optional[Any]{self._field_spec(prop, sanitized_prop, "None")}'''
             
             # Add type-specific fields
             if aspect_type == 'versioned':
@@ -233,65 +275,56 @@ class {aspect_name.title()}AspectUpsertRequest(BaseModel):
     entity_params: Optional[Dict[str, Any]] = Field(None, description="Entity creation parameters")
 '''
             
-            # Generate get request model
+            # Get and delete requests share the entity-target schemas
+            get_request_model = "TimeseriesAspectGetRequest" if aspect_type == 'timeseries' else "AspectTargetRequest"
+            model_names += [f"{aspect_name.title()}AspectGetRequest", f"{aspect_name.title()}AspectDeleteRequest"]
             models_content += f'''
 
-class {aspect_name.title()}AspectGetRequest(BaseModel):
-    """Request model for getting {aspect_name} aspect"""
-    entity_label: str = Field(..., description="Entity label")
-    entity_urn: str = Field(..., description="Entity URN")
-'''
-            
-            if aspect_type == 'timeseries':
-                models_content += '''    limit: Optional[int] = Field(100, description="Limit for timeseries aspects")
-'''
-            
-            # Generate delete request model
-            models_content += f'''
-
-class {aspect_name.title()}AspectDeleteRequest(BaseModel):
-    """Request model for deleting {aspect_name} aspect"""
-    entity_label: str = Field(..., description="Entity label")
-    entity_urn: str = Field(..., description="Entity URN")
+{aspect_name.title()}AspectGetRequest = {get_request_model}
+{aspect_name.title()}AspectDeleteRequest = AspectTargetRequest
 '''
             
             # Generate response model
             payload_type = "List[Dict[str, Any]]" if aspect_type == 'timeseries' else "Dict[str, Any]"
+            model_names.append(f"{aspect_name.title()}AspectResponse")
             models_content += f'''
 
-class {aspect_name.title()}AspectResponse(BaseModel):
+@response_dto
+class {aspect_name.title()}AspectResponse:
     """Response model for {aspect_name} aspect"""
-    entity_label: str = Field(..., description="Entity label")
-    entity_urn: str = Field(..., description="Entity URN")
-    aspect_name: str = Field(..., description="Aspect name")
-    payload: {payload_type} = Field(..., description="Aspect payload")
+    entity_label: str
+    entity_urn: str
+    aspect_name: str
+    payload: {payload_type}
 '''
             
             if aspect_type == 'versioned':
-                models_content += '''    version: Optional[int] = Field(None, description="Version")
+                models_content += '''    version: Optional[int] = None
 '''
             elif aspect_type == 'timeseries':
-                models_content += '''    timestamp_ms: Optional[int] = Field(None, description="Timestamp")
+                models_content += '''    timestamp_ms: Optional[int] = None
 '''
         
         # Generate utility models
+        model_names += ["UtilityRequest", "UtilityResponse", "DiscoveryRequest", "DiscoveryResponse"]
         models_content += '''
 
 # Utility models
-class UtilityRequest(BaseModel):
+class UtilityRequest(APIRequest):
     """Request model for utility functions"""
     function_name: str = Field(..., description="Name of the utility function")
     parameters: Optional[Dict[str, Any]] = Field(None, description="Function parameters")
 
 
-class UtilityResponse(BaseModel):
+@response_dto
+class UtilityResponse:
     """Response model for utility functions"""
-    result: Any = Field(..., description="Function result")
-    function_name: str = Field(..., description="Name of the utility function")
+    result: Any
+    function_name: str
 
 
 # Discovery models
-class DiscoveryRequest(BaseModel):
+class DiscoveryRequest(APIRequest):
     """Request model for relationship discovery"""
     entity_urn: str = Field(..., description="Entity URN")
     entity_type: str = Field(..., description="Entity type")
@@ -299,12 +332,16 @@ class DiscoveryRequest(BaseModel):
     aspect_data: Dict[str, Any] = Field(..., description="Aspect data")
 
 
-class DiscoveryResponse(BaseModel):
+@response_dto
+class DiscoveryResponse:
     """Response model for relationship discovery"""
-    message: str = Field(..., description="Discovery result message")
-    relationships_created: int = Field(..., description="Number of relationships created")
+    message: str
+    relationships_created: int
 '''
         
+        # Export every generated model explicitly
+        models_content += '\n\n__all__ = [\n' + ''.join(f'    "{name}",\n' for name in model_names) + ']\n'
+        
         # Write models file
         with open(self.output_dir / "models.py", "w") as f:
             f.write(models_content)
@@ -334,13 +371,13 @@ async def health_check():
     """Health check endpoint"""
     try:
         factory = factory_wrapper.get_factory_instance()
-        return models.HealthResponse(
-            status="healthy",
-            registry_loaded=True,
-            available_entities=list(factory.registry.get('entities', {}).keys()),
-            available_aspects=list(factory.registry.get('aspects', {}).keys()),
-            available_utilities=list(factory.registry.get('utility_functions', {}).keys())
-        )
+        return {
+            "status": "healthy",
+            "registry_loaded": True,
+            "available_entities": list(factory.registry.get('entities', {}).keys()),
+            "available_aspects": list(factory.registry.get('aspects', {}).keys()),
+            "available_utilities": list(factory.registry.get('utility_functions', {}).keys())
+        }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -354,27 +391,26 @@ async def health_check():
             method_name = self._get_method_name_for_entity(entity_name, "get")
             routes_content += f'''
 @router.get("/entities/{entity_name}/{{urn}}", response_model=models.{entity_name}Response)
-async def get_{entity_name}(urn: str):
+def get_{entity_name}(urn: str):
     """Get {entity_name} entity by URN"""
     try:
-        factory = factory_wrapper.get_factory_instance()
         writer = factory_wrapper.get_writer_instance()
         
         method_name = "{method_name}"
-        if not hasattr(writer, method_name):
+        method = getattr(writer, method_name, None)
+        if method is None:
             raise HTTPException(status_code=400, detail=f"Entity type '{entity_name}' not found")
         
-        method = getattr(writer, method_name)
         result = method(urn)
         
         if result is None:
             raise HTTPException(status_code=404, detail=f"{entity_name} with URN '{{urn}}' not found")
         
-        return models.{entity_name}Response(
-            urn=urn,
-            properties=result,
-            last_updated=result.get('lastUpdated')
-        )
+        return {{
+            "urn": urn,
+            "properties": result,
+            "last_updated": result.get('lastUpdated')
+        }}
     except HTTPException:
         raise
     except Exception as e:
@@ -392,31 +428,30 @@ async def get_{entity_name}(urn: str):
                 # Timeseries aspects need limit parameter and return list
                 routes_content += f'''
 @router.get("/aspects/{aspect_name}/{{entity_label}}/{{entity_urn}}", response_model=models.{aspect_name.title()}AspectResponse)
-async def get_{aspect_name}_aspect(entity_label: str, entity_urn: str, limit: int = 100):
+def get_{aspect_name}_aspect(entity_label: str, entity_urn: str, limit: int = 100):
     """Get {aspect_name} aspect for entity"""
     try:
-        factory = factory_wrapper.get_factory_instance()
         writer = factory_wrapper.get_writer_instance()
         
         method_name = "{method_name}"
-        if not hasattr(writer, method_name):
-            # Debug: list available methods
-            available_methods = [m for m in dir(writer) if not m.startswith('_') and 'aspect' in m]
+        method = getattr(writer, method_name, None)
+        if method is None:
+            # Generated methods live on the instance, so list them without walking the class via dir()
+            available_methods = sorted(m for m in vars(writer) if not m.startswith('_') and 'aspect' in m)
             raise HTTPException(status_code=400, detail=f"Aspect '{aspect_name}' not found. Available aspect methods: {{available_methods}}")
         
-        method = getattr(writer, method_name)
         result = method(entity_label, entity_urn, limit)
         
         if result is None:
             raise HTTPException(status_code=404, detail=f"{aspect_name} aspect not found")
         
-        return models.{aspect_name.title()}AspectResponse(
-            entity_label=entity_label,
-            entity_urn=entity_urn,
-            aspect_name="{aspect_name}",
-            payload=result,
-            timestamp_ms=result[0].get('timestamp_ms') if result and len(result) > 0 else None
-        )
+        return {{
+            "entity_label": entity_label,
+            "entity_urn": entity_urn,
+            "aspect_name": "{aspect_name}",
+            "payload": result,
+            "timestamp_ms": result[0].get('timestamp_ms') if result and len(result) > 0 else None
+        }}
     except HTTPException:
         raise
     except Exception as e:
@@ -426,31 +461,30 @@ async def get_{aspect_name}_aspect(entity_label: str, entity_urn: str, limit: in
                 # Versioned aspects don't need limit parameter and return dict
                 routes_content += f'''
 @router.get("/aspects/{aspect_name}/{{entity_label}}/{{entity_urn}}", response_model=models.{aspect_name.title()}AspectResponse)
-async def get_{aspect_name}_aspect(entity_label: str, entity_urn: str):
+def get_{aspect_name}_aspect(entity_label: str, entity_urn: str):
     """Get {aspect_name} aspect for entity"""
     try:
-        factory = factory_wrapper.get_factory_instance()
         writer = factory_wrapper.get_writer_instance()
         
         method_name = "{method_name}"
-        if not hasattr(writer, method_name):
-            # Debug: list available methods
-            available_methods = [m for m in dir(writer) if not m.startswith('_') and 'aspect' in m]
+        method = getattr(writer, method_name, None)
+        if method is None:
+            # Generated methods live on the instance, so list them without walking the class via dir()
+            available_methods = sorted(m for m in vars(writer) if not m.startswith('_') and 'aspect' in m)
             raise HTTPException(status_code=400, detail=f"Aspect '{aspect_name}' not found. Available aspect methods: {{available_methods}}")
         
-        method = getattr(writer, method_name)
         result = method(entity_label, entity_urn)
         
         if result is None:
             raise HTTPException(status_code=404, detail=f"{aspect_name} aspect not found")
         
-        return models.{aspect_name.title()}AspectResponse(
-            entity_label=entity_label,
-            entity_urn=entity_urn,
-            aspect_name="{aspect_name}",
-            payload=result,
-            version=result.get('version') if isinstance(result, dict) else None
-        )
+        return {{
+            "entity_label": entity_label,
+            "entity_urn": entity_urn,
+            "aspect_name": "{aspect_name}",
+            "payload": result,
+            "version": result.get('version') if isinstance(result, dict) else None
+        }}
     except HTTPException:
         raise
     except Exception as e:
@@ -488,39 +522,38 @@ router = APIRouter(prefix="/api/v1", tags=["UPSERT Operations"])
             method_name = self._get_method_name_for_entity(entity_name, "upsert")
             routes_content += f'''
 @router.post("/entities/{entity_name}", response_model=models.{entity_name}Response)
-async def upsert_{entity_name}(request: models.{entity_name}UpsertRequest):
+def upsert_{entity_name}(request: models.{entity_name}UpsertRequest):
     """Upsert {entity_name} entity"""
     try:
-        factory = factory_wrapper.get_factory_instance()
         writer = factory_wrapper.get_writer_instance()
         
         method_name = "{method_name}"
-        if not hasattr(writer, method_name):
+        method = getattr(writer, method_name, None)
+        if method is None:
             raise HTTPException(status_code=400, detail=f"Entity type '{entity_name}' not found")
         
-        method = getattr(writer, method_name)
-        
         # Extract parameters from request
-        params = request.dict()
-        additional_properties = params.pop('additional_properties', None)
+        params = request.model_dump(exclude={{'additional_properties'}})
         
         # Add additional properties if provided
-        if additional_properties:
-            params.update(additional_properties)
-        
-        # Call the generated method - URN will be generated automatically
-        result_urn = method(**params)
-        
-        # Get the created/updated entity
-        get_method_name = "{self._get_method_name_for_entity(entity_name, 'get')}"
-        get_method = getattr(writer, get_method_name)
-        entity_data = get_method(result_urn)
-        
-        return models.{entity_name}Response(
-            urn=result_urn,
-            properties=entity_data or {{}},
-            last_updated=entity_data.get('lastUpdated') if entity_data else None
-        )
+        if request.additional_properties:
+            params.update(request.additional_properties)
+        
+        # The write and the read-back share one session instead of checking out two
+        with writer.session():
+            # Call the generated method - URN will be generated automatically
+            result_urn = method(**params)
+        
+            # Get the created/updated entity
+            get_method_name = "{self._get_method_name_for_entity(entity_name, 'get')}"
+            get_method = getattr(writer, get_method_name)
+            entity_data = get_method(result_urn)
+        
+        return {{
+            "urn": result_urn,
+            "properties": entity_data or {{}},
+            "last_updated": entity_data.get('lastUpdated') if entity_data else None
+        }}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 '''
@@ -529,20 +562,33 @@ async def upsert_{entity_name}(request: models.{entity_name}UpsertRequest):
         aspects = self.factory.registry.get('aspects', {})
         for aspect_name in sorted(aspects.keys()):
             method_name = self._get_method_name_for_aspect(aspect_name, "upsert")
+            aspect_config = aspects[aspect_name]
+            is_versioned = aspect_config.get('type', 'versioned') == 'versioned'
+            # Resolve registry property -> request field names at generation time
+            payload_fields = tuple(
+                (prop, self._sanitize_field_name(prop)) for prop in aspect_config.get('properties', [])
+            )
+            payload_fields_name = f"{aspect_name.upper()}_PAYLOAD_FIELDS"
+            version_param = '''
+        if request.version is not None:
+            params["version"] = request.version
+        ''' if is_versioned else ''
+            version_value = "request.version" if is_versioned else "None"
             routes_content += f'''
+{payload_fields_name} = {payload_fields!r}
+
+
 @router.post("/aspects/{aspect_name}", response_model=models.{aspect_name.title()}AspectResponse)
-async def upsert_{aspect_name}_aspect(request: models.{aspect_name.title()}AspectUpsertRequest):
+def upsert_{aspect_name}_aspect(request: models.{aspect_name.title()}AspectUpsertRequest):
     """Upsert {aspect_name} aspect"""
     try:
-        factory = factory_wrapper.get_factory_instance()
         writer = factory_wrapper.get_writer_instance()
         
         method_name = "{method_name}"
-        if not hasattr(writer, method_name):
+        method = getattr(writer, method_name, None)
+        if method is None:
             raise HTTPException(status_code=400, detail=f"Aspect '{aspect_name}' not found")
         
-        method = getattr(writer, method_name)
-        
         # Prepare parameters - extract all fields except entity_label, entity_urn, entity_params, version, timestamp_ms
         params = {{
             "entity_label": request.entity_label,
@@ -550,23 +596,14 @@ async def upsert_{aspect_name}_aspect(request: models.{aspect_name.title()}Aspec
         }}
         
         # Add all aspect-specific fields to payload
-        aspect_config = factory.registry.get('aspects', {{}}).get('{aspect_name}', {{}})
-        aspect_properties = aspect_config.get('properties', [])
-        
         payload = {{}}
-        for prop in aspect_properties:
-            if hasattr(request, prop) and getattr(request, prop) is not None:
-                payload[prop] = getattr(request, prop)
+        for prop, field_name in {payload_fields_name}:
+            value = getattr(request, field_name)
+            if value is not None:
+                payload[prop] = value
         
         params["payload"] = payload
-        
-        # Add optional parameters - only for versioned aspects
-        aspect_config = factory.registry.get('aspects', {{}}).get('{aspect_name}', {{}})
-        aspect_type = aspect_config.get('type', 'versioned')
-        
-        if aspect_type == 'versioned' and hasattr(request, 'version') and request.version is not None:
-            params["version"] = request.version
-        
+        {version_param}
         # Add entity creation parameters
         entity_params = request.entity_params
         if entity_params:
@@ -575,13 +612,13 @@ async def upsert_{aspect_name}_aspect(request: models.{aspect_name.title()}Aspec
         # Call the generated method
         result = method(**params)
         
-        return models.{aspect_name.title()}AspectResponse(
-            entity_label=request.entity_label or "unknown",
-            entity_urn=request.entity_urn or "unknown",
-            aspect_name="{aspect_name}",
-            payload=payload,
-            version=request.version if aspect_type == 'versioned' and hasattr(request, 'version') else None
-        )
+        return {{
+            "entity_label": request.entity_label or "unknown",
+            "entity_urn": request.entity_urn or "unknown",
+            "aspect_name": "{aspect_name}",
+            "payload": payload,
+            "version": {version_value}
+        }}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 '''
@@ -617,17 +654,16 @@ router = APIRouter(prefix="/api/v1", tags=["DELETE Operations"])
             method_name = self._get_method_name_for_entity(entity_name, "delete")
             routes_content += f'''
 @router.delete("/entities/{entity_name}/{{urn}}")
-async def delete_{entity_name}(urn: str):
+def delete_{entity_name}(urn: str):
     """Delete {entity_name} entity by URN"""
     try:
-        factory = factory_wrapper.get_factory_instance()
         writer = factory_wrapper.get_writer_instance()
         
         method_name = "{method_name}"
-        if not hasattr(writer, method_name):
+        method = getattr(writer, method_name, None)
+        if method is None:
             raise HTTPException(status_code=400, detail=f"Entity type '{entity_name}' not found")
         
-        method = getattr(writer, method_name)
         method(urn)
         
         return {{"message": f"{entity_name} with URN '{{urn}}' deleted successfully"}}
@@ -641,17 +677,16 @@ async def delete_{entity_name}(urn: str):
             method_name = self._get_method_name_for_aspect(aspect_name, "delete")
             routes_content += f'''
 @router.delete("/aspects/{aspect_name}/{{entity_label}}/{{entity_urn}}")
-async def delete_{aspect_name}_aspect(entity_label: str, entity_urn: str):
+def delete_{aspect_name}_aspect(entity_label: str, entity_urn: str):
     """Delete {aspect_name} aspect for entity"""
     try:
-        factory = factory_wrapper.get_factory_instance()
         writer = factory_wrapper.get_writer_instance()
         
         method_name = "{method_name}"
-        if not hasattr(writer, method_name):
+        method = getattr(writer, method_name, None)
+        if method is None:
             raise HTTPException(status_code=400, detail=f"Aspect '{aspect_name}' not found")
         
-        method = getattr(writer, method_name)
         method(entity_label, entity_urn)
         
         return {{"message": f"{aspect_name} aspect deleted successfully for entity '{{entity_urn}}'"}}
@@ -672,18 +707,19 @@ async def delete_{aspect_name}_aspect(entity_label: str, entity_urn: str):
 Factory wrapper for dependency injection
 """
 
+import atexit
 import os
 import sys
+import threading
 from typing import Optional
 
-# Add the parent directory to sys.path to import the registry module
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from neo4j.exceptions import DriverError, Neo4jError
 
 try:
     from yaml2graph.registry.factory import RegistryFactory
 except ImportError:
-    # Fallback for when running as standalone
-    sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+    # Fallback for when running as standalone from a source checkout
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
     from yaml2graph.registry.factory import RegistryFactory
 
 
@@ -693,6 +729,8 @@ class FactoryWrapper:
     _instance: Optional['FactoryWrapper'] = None
     _factory: Optional[RegistryFactory] = None
     _writer = None
+    # Routes run in a threadpool; the lock keeps a single factory, writer and driver pool
+    _lock = threading.Lock()
     
     def __init__(self):
         # Try multiple possible registry paths
@@ -727,17 +765,35 @@ class FactoryWrapper:
     def get_writer_instance(self):
         """Get or create writer instance"""
         if self._writer is None:
-            uri = os.getenv("NEO4J_URI", "bolt://localhost:7687")
-            user = os.getenv("NEO4J_USER", "neo4j")
-            password = os.getenv("NEO4J_PASSWORD", "password")
-            self._writer = self._factory.create_writer(uri, user, password)
+            with self._lock:
+                if self._writer is None:
+                    uri = os.getenv("NEO4J_URI", "bolt://localhost:7687")
+                    user = os.getenv("NEO4J_USER", "neo4j")
+                    password = os.getenv("NEO4J_PASSWORD", "password")
+                    # Route handlers and batch write workers share this pool, so let deployments size it
+                    driver_config = {}
+                    if os.getenv("NEO4J_MAX_CONNECTION_POOL_SIZE"):
+                        driver_config["max_connection_pool_size"] = int(os.getenv("NEO4J_MAX_CONNECTION_POOL_SIZE"))
+                    writer = self._factory.create_writer(uri, user, password, **driver_config)
+                    # Every lookup matches on urn; constrain and index it once per process unless disabled
+                    if os.getenv("NEO4J_CREATE_INDEXES", "true").lower() in ("1", "true", "yes"):
+                        try:
+                            writer.create_indexes()
+                        except (Neo4jError, DriverError) as e:
+                            # Indexes only speed up lookups; a database failure must not stop the writer from being cached
+                            writer.logger.warning("Skipping index creation", error=str(e), error_type=type(e).__name__)
+                    # The writer and its connection pool live for the process; close the driver once at exit
+                    atexit.register(writer.close)
+                    self._writer = writer
         return self._writer
     
     @classmethod
     def get_instance(cls) -> 'FactoryWrapper':
         """Get singleton instance"""
         if cls._instance is None:
-            cls._instance = cls()
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = cls()
         return cls._instance
 
 
@@ -808,11 +864,21 @@ if __name__ == "__main__":
     # Get configuration from environment
     host = os.getenv("API_HOST", "0.0.0.0")
     port = int(os.getenv("API_PORT", "8000"))
+    # Per-request access logging is off by default; set API_ACCESS_LOG=true to enable it
+    access_log = os.getenv("API_ACCESS_LOG", "false").lower() in ("1", "true", "yes")
+    workers = int(os.getenv("API_WORKERS", "1"))
     
     print(f"🚀 Starting RegistryFactory API server on {host}:{port}")
     print(f" API Documentation: http://{host}:{port}/docs")
     
-    uvicorn.run(app, host=host, port=port)
+    # loop and http stay on uvicorn's "auto", which uses uvloop and httptools when installed
+    uvicorn.run(
+        "main:app" if workers > 1 else app,
+        host=host,
+        port=port,
+        workers=workers,
+        access_log=access_log
+    )
 '''
         
         # Write main app file
@@ -890,6 +956,10 @@ export NEO4J_USER="neo4j"
 export NEO4J_PASSWORD="password"
 export API_HOST="0.0.0.0"
 export API_PORT="8000"
+export API_ACCESS_LOG="false"  # Optional - per-request access logging, off by default
+export API_WORKERS="1"  # Optional - number of uvicorn worker processes
+export NEO4J_CREATE_INDEXES="true"  # Optional - create urn constraints and lookup indexes when the writer starts
+export NEO4J_MAX_CONNECTION_POOL_SIZE="100"  # Optional - Bolt connection pool size, driver default when unset
 ```
 
 3. Run the API:
@@ -4,11 +4,6 @@ Script to run the API generator
 """
 
 import os
-import sys
-from pathlib import Path
-
-# Add current directory to path
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from yaml2graph.api_generator.generator import APIGenerator
 
@@ -100,14 +100,17 @@ class CLIGenerator:
 Factory wrapper for CLI dependency injection
 """
 
+import atexit
 import os
 import sys
 from typing import Optional
 
-# Add parent directory to path to import registry modules
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from yaml2graph.registry.factory import RegistryFactory
+try:
+    from yaml2graph.registry.factory import RegistryFactory
+except ImportError:
+    # Fallback for when running as standalone
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+    from yaml2graph.registry.factory import RegistryFactory
 
 
 class FactoryWrapper:
@@ -151,6 +154,8 @@ class FactoryWrapper:
             user = os.getenv("NEO4J_USER", "neo4j")
             password = os.getenv("NEO4J_PASSWORD", "password")
             self._writer = self._factory.create_writer(uri, user, password)
+            # Commands share this writer's connection pool; close the driver once at exit
+            atexit.register(self._writer.close)
         return self._writer
     
     @classmethod
@@ -223,11 +228,11 @@ def get_{entity_name.lower()}(urn: str, output: str):
         writer = _get_writer()
         
         method_name = "{method_name}"
-        if not hasattr(writer, method_name):
+        method = getattr(writer, method_name, None)
+        if method is None:
             click.echo(f"❌ Entity type '{entity_name}' not found", err=True)
             return
         
-        method = getattr(writer, method_name)
         result = method(urn)
         
         if result is None:
@@ -268,12 +273,11 @@ def upsert_{entity_name.lower()}({', '.join([prop.lower() for prop in properties
         writer = _get_writer()
         
         method_name = "{upsert_method_name}"
-        if not hasattr(writer, method_name):
+        method = getattr(writer, method_name, None)
+        if method is None:
             click.echo(f"❌ Entity type '{entity_name}' not found", err=True)
             return
         
-        method = getattr(writer, method_name)
-        
         # Prepare parameters
         params = {{}}
 '''
@@ -300,13 +304,15 @@ def upsert_{entity_name.lower()}({', '.join([prop.lower() for prop in properties
                 click.echo("❌ Invalid JSON in additional-properties", err=True)
                 return
         
-        # Call the generated method - URN will be generated automatically
-        result_urn = method(**params)
+        # The write and the read-back share one session instead of checking out two
+        with writer.session():
+            # Call the generated method - URN will be generated automatically
+            result_urn = method(**params)
         
-        # Get the created/updated entity
-        get_method_name = "{method_name}"
-        get_method = getattr(writer, get_method_name)
-        entity_data = get_method(result_urn)
+            # Get the created/updated entity
+            get_method_name = "{method_name}"
+            get_method = getattr(writer, get_method_name)
+            entity_data = get_method(result_urn)
         
         result = {{
             "urn": result_urn,
@@ -349,12 +355,11 @@ def delete_{entity_name.lower()}({', '.join([prop.lower() for prop in properties
         writer = _get_writer()
         
         method_name = "{delete_method_name}"
-        if not hasattr(writer, method_name):
+        method = getattr(writer, method_name, None)
+        if method is None:
             click.echo(f"❌ Entity type '{entity_name}' not found", err=True)
             return
         
-        method = getattr(writer, method_name)
-        
         # Prepare parameters (same as upsert to generate the same URN)
         params = dict()
 '''
@@ -478,11 +483,11 @@ def get_{aspect_name.lower()}_aspect(entity_label: str, entity_urn: str'''
         writer = _get_writer()
         
         method_name = "{method_name}"
-        if not hasattr(writer, method_name):
+        method = getattr(writer, method_name, None)
+        if method is None:
             click.echo(f"❌ Aspect '{aspect_name}' not found", err=True)
             return
         
-        method = getattr(writer, method_name)
 '''
             
             if aspect_type == 'timeseries':
@@ -647,12 +652,11 @@ def upsert_{aspect_name.lower()}_aspect('''
         factory = _get_factory()
         
         method_name = "{upsert_method_name}"
-        if not hasattr(writer, method_name):
+        method = getattr(writer, method_name, None)
+        if method is None:
             click.echo(f"❌ Aspect '{aspect_name}' not found", err=True)
             return
         
-        method = getattr(writer, method_name)
-        
         # Prepare parameters - URN will be auto-generated by factory
         params = {{}}
         
@@ -838,12 +842,11 @@ def upsert_{aspect_name.lower()}_aspect('''
         writer = _get_writer()
         
         method_name = "{delete_method_name}"
-        if not hasattr(writer, method_name):
+        method = getattr(writer, method_name, None)
+        if method is None:
             click.echo(f"❌ Aspect '{aspect_name}' not found", err=True)
             return
         
-        method = getattr(writer, method_name)
-        
         # Prepare parameters (same as upsert to generate the same URN)
         params = {{}}
         
@@ -1048,13 +1051,8 @@ Main CLI application
 """
 
 import click
-import os
-import sys
-from pathlib import Path
-
-# Add current directory to path for imports
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+# The script's own directory is already first on sys.path when run directly
 import entity_commands
 import aspect_commands
 import utility_commands
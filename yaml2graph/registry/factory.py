@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
-from typing import Any, Dict, Type
+from typing import Any, Callable, Dict, Type
 from ..utils.logging_config import get_logger, log_function_call, log_function_result, log_error_with_context
 from .loaders import RegistryLoader
 from .validators import RegistryValidator
@@ -37,6 +37,8 @@ class RegistryFactory:
             self.utility_functions = self.utility_builder.create_functions()
             self.urn_generators = self.urn_generator.create_generators()
             self.aspect_processors = self.aspect_processor.create_processors()
+            # The writer class depends only on the registry, so it is generated once per factory
+            self._writer_class = None
             
             self.logger.info("RegistryFactory initialized successfully", 
                            registry_path=registry_path,
@@ -52,12 +54,14 @@ class RegistryFactory:
         log_function_call(self.logger, "validate_aspect_payload", aspect_name=aspect_name)
         
         try:
-            if aspect_name not in self.aspect_processors:
+            # Processors are compiled once per aspect when the factory is built; this only dispatches
+            processor = self.aspect_processors.get(aspect_name)
+            if processor is None:
                 self.logger.error(f"Aspect '{aspect_name}' not defined in registry", 
                                 available_aspects=list(self.aspect_processors.keys()))
                 raise ValueError(f"Aspect '{aspect_name}' not defined in registry")
             
-            result = self.aspect_processors[aspect_name](payload)
+            result = processor(payload)
             log_function_result(self.logger, "validate_aspect_payload", result=result)
             return result
             
@@ -65,6 +69,13 @@ class RegistryFactory:
             log_error_with_context(self.logger, e, "validate_aspect_payload")
             raise
     
+    def get_aspect_processor(self, aspect_name: str) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+        """Resolve an aspect's payload processor once, for callers validating many payloads of that aspect"""
+        processor = self.aspect_processors.get(aspect_name)
+        if processor is None:
+            raise ValueError(f"Aspect '{aspect_name}' not defined in registry")
+        return processor
+    
     def generate_neo4j_writer_class(self) -> Type:
         """Generate Neo4jMetadataWriter class dynamically from registry"""
         log_function_call(self.logger, "generate_neo4j_writer_class")
@@ -85,13 +96,16 @@ class RegistryFactory:
             log_error_with_context(self.logger, e, "generate_neo4j_writer_class")
             raise
     
-    def create_writer(self, uri: str, user: str, password: str) -> Any:
-        """Create Neo4jMetadataWriter instance"""
-        log_function_call(self.logger, "create_writer", uri=uri, user=user)
+    def create_writer(self, uri: str, user: str, password: str, **driver_config: Any) -> Any:
+        """Create Neo4jMetadataWriter instance; driver_config is passed to the Neo4j driver"""
+        log_function_call(self.logger, "create_writer", uri=uri, user=user, driver_config=driver_config)
         
         try:
-            writer_class = self.generate_neo4j_writer_class()
-            writer_instance = writer_class(uri, user, password, self.registry, self.urn_generators, self.utility_functions, self)
+            if self._writer_class is None:
+                self._writer_class = self.generate_neo4j_writer_class()
+            writer_class = self._writer_class
+            writer_instance = writer_class(uri, user, password, self.registry, self.urn_generators, self.utility_functions, self,
+                                           **driver_config)
             log_function_result(self.logger, "create_writer", 
                               writer_class_name=writer_class.__name__)
             return writer_instance
@@ -2,9 +2,16 @@
 from __future__ import annotations
 
 import datetime as dt
+import functools
 import re
+import time
 from typing import Any, Dict, Callable
 
+from ..utils.logging_config import get_logger, log_error_with_context
+
+# Per-generator bound on memoized URNs; ingests repeat the same platforms, owners and datasets
+URN_CACHE_SIZE = 4096
+
 
 class UtilityFunctionBuilder:
     """Builds utility functions from registry definitions"""
@@ -54,11 +61,14 @@ class UtilityFunctionBuilder:
             pattern = utility_config.get(implementation.get('pattern_config', ''), r"[^a-zA-Z0-9_.-]+")
             replacement = utility_config.get(implementation.get('replacement_config', ''), "_")
             strip_method = utility_config.get(implementation.get('strip_method_config', ''), 'strip')
+            # Patterns come from the registry, so compile them once per built function
+            sub = re.compile(pattern).sub
+            pre_strip = implementation.get('pre_processing') == 'strip'
             
             def func(raw):
-                if implementation.get('pre_processing') == 'strip':
+                if pre_strip:
                     raw = getattr(raw, strip_method)()
-                return re.sub(pattern, replacement, raw)
+                return sub(replacement, raw)
             return func
             
         elif operation == 'split_and_extract':
@@ -70,11 +80,12 @@ class UtilityFunctionBuilder:
             if post_processing == 'regex_replace':
                 pattern = utility_config.get(implementation.get('pattern_config', ''), r"[^a-zA-Z0-9_.-]+")
                 replacement = utility_config.get(implementation.get('replacement_config', ''), "_")
+                sub = re.compile(pattern).sub
                 
                 def func(email):
                     if separator in email:
                         username = email.split(separator, split_limit)[split_index]
-                        return re.sub(pattern, replacement, username)
+                        return sub(replacement, username)
                     return email
                 return func
             else:
@@ -98,9 +109,10 @@ class UtilityFunctionBuilder:
                 pattern = utility_config.get(implementation.get('pattern_config', ''), r"(pass|secret|key|token)")
                 regex_flag = utility_config.get(implementation.get('regex_flag_config', ''), 'IGNORECASE')
                 replacement = utility_config.get(implementation.get('replacement_config', ''), "****")
+                search = re.compile(pattern, getattr(re, regex_flag)).search
                 
                 def func(k, v):
-                    if re.search(pattern, k, getattr(re, regex_flag)):
+                    if search(k):
                         return replacement
                     return v
                 return func
@@ -117,21 +129,27 @@ class UtilityFunctionBuilder:
             timezone = utility_config.get(implementation.get('timezone_config', ''), 'UTC')
             post_processing = implementation.get('post_processing', '')
             
+            # Resolve the clock and timezone once instead of on every call
+            now = getattr(dt.datetime, method)
+            tz = dt.timezone.utc if timezone == 'UTC' else getattr(dt, timezone)
+            
             if post_processing == 'timestamp_multiply':
                 multiplier = utility_config.get(implementation.get('multiplier_config', ''), 1000)
                 
+                if method == 'now' and isinstance(multiplier, int) and multiplier > 0 and 10**9 % multiplier == 0:
+                    # Epoch time is timezone independent, so integer nanoseconds avoid building a datetime
+                    divisor = 10**9 // multiplier
+                    
+                    def func():
+                        return time.time_ns() // divisor
+                    return func
+                
                 def func():
-                    if timezone == 'UTC':
-                        return int(getattr(dt.datetime, method)(dt.timezone.utc).timestamp() * multiplier)
-                    else:
-                        return int(getattr(dt.datetime, method)(getattr(dt, timezone)).timestamp() * multiplier)
+                    return int(now(tz).timestamp() * multiplier)
                 return func
             else:
                 def func():
-                    if timezone == 'UTC':
-                        return getattr(dt.datetime, method)(dt.timezone.utc)
-                    else:
-                        return getattr(dt.datetime, method)(getattr(dt, timezone))
+                    return now(tz)
                 return func
         
         else:
@@ -157,45 +175,66 @@ class URNGenerator:
     def __init__(self, registry: Dict[str, Any], utility_builder: UtilityFunctionBuilder):
         self.registry = registry
         self.utility_builder = utility_builder
+        self.logger = get_logger("lineagentic.registry.generators")
+        # Field names of the conditional string templates, read once rather than per URN field
+        string_config = registry.get('string_processing', {})
+        self._string_template_fields = (
+            string_config.get('pattern_field', 'pattern'),
+            string_config.get('value_field', 'value'),
+            string_config.get('when_value_present_field', 'when_value_present'),
+            string_config.get('when_value_absent_field', 'when_value_absent'),
+        )
     
     def create_generators(self) -> Dict[str, Callable]:
         """Create URN generator functions from registry patterns"""
         def process_urn_pattern(name: str, pattern: Dict[str, Any]) -> Callable:
             def create_urn_generator(pattern, pattern_name, utils):
                 def urn_generator(**kwargs):
-                    context_config = self.registry.get('context_config', {})
-                    pattern_field = context_config.get('pattern_field', 'pattern')
-                    generators_field = context_config.get('generators_field', 'generators')
-                    
                     context = kwargs.copy()
                     context[pattern_field] = pattern
                     context[generators_field] = generators
                     
-                    field_config = self.registry.get('field_processing', {})
-                    skip_fields = field_config.get('skip_fields', ['template'])
-                    context_fields = field_config.get('context_fields', ['pattern', 'generators'])
-                    prefix_config = field_config.get('prefix_config', {'section': 'metadata', 'field': 'urn_prefix'})
-                    
                     for field_name, field_value in pattern.items():
                         if field_name in skip_fields:
                             continue
                         
                         self._process_field_generically(field_name, field_value, context, utils)
                     
-                    prefix_section = self.registry.get(prefix_config['section'], {})
-                    prefix_value = prefix_section.get(prefix_config['field'], '')
                     formatted = pattern['template'].format(
                         prefix=prefix_value,
                         **{k: v for k, v in context.items() if k not in context_fields}
                     )
                     return formatted
                 
-                return urn_generator
+                cached = functools.lru_cache(maxsize=URN_CACHE_SIZE)(lambda key: urn_generator(**dict(key)))
+                
+                def memoized_urn_generator(**kwargs):
+                    # Only string/None inputs are cached: they are hashable and cannot collide across types (1 == True)
+                    if all(v is None or v.__class__ is str for v in kwargs.values()):
+                        return cached(tuple(kwargs.items()))
+                    return urn_generator(**kwargs)
+                
+                memoized_urn_generator.__wrapped__ = urn_generator
+                memoized_urn_generator.cache_clear = cached.cache_clear
+                memoized_urn_generator.cache_info = cached.cache_info
+                return memoized_urn_generator
             
-            return create_urn_generator(pattern, name, self.utility_builder.create_functions())
+            return create_urn_generator(pattern, name, utils)
         
         section_config = self.registry.get('section_config', {})
         urn_patterns_section = section_config.get('urn_patterns_section', 'urn_patterns')
+        # Build the utility functions once and share them across all patterns
+        utils = self.utility_builder.create_functions()
+        
+        # Field handling and the URN prefix are fixed by the registry, so resolve them once for every generator
+        context_config = self.registry.get('context_config', {})
+        pattern_field = context_config.get('pattern_field', 'pattern')
+        generators_field = context_config.get('generators_field', 'generators')
+        field_config = self.registry.get('field_processing', {})
+        skip_fields = frozenset(field_config.get('skip_fields', ('template',)))
+        context_fields = frozenset(field_config.get('context_fields', ('pattern', 'generators')))
+        prefix_config = field_config.get('prefix_config', {'section': 'metadata', 'field': 'urn_prefix'})
+        prefix_value = self.registry.get(prefix_config['section'], {}).get(prefix_config['field'], '')
         
         generators = {}
         if urn_patterns_section in self.registry:
@@ -230,11 +269,7 @@ class URNGenerator:
                         context[f'list_{field_name}'] = field_value
             
             elif isinstance(field_value, str):
-                string_config = self.registry.get('string_processing', {})
-                pattern_field = string_config.get('pattern_field', 'pattern')
-                value_field = string_config.get('value_field', 'value')
-                when_value_present_field = string_config.get('when_value_present_field', 'when_value_present')
-                when_value_absent_field = string_config.get('when_value_absent_field', 'when_value_absent')
+                pattern_field, value_field, when_value_present_field, when_value_absent_field = self._string_template_fields
                 
                 pattern = context.get(pattern_field, {})
                 for rule_key, rule_value in pattern.items():
@@ -251,7 +286,7 @@ class URNGenerator:
             else:
                 context[f'field_{field_name}'] = field_value
         except Exception as e:
-            print(f"Error processing field '{field_name}' with value {field_value}: {e}")
+            log_error_with_context(self.logger, e, "URN field processing", field_name=field_name, field_value=field_value)
             raise
 
 
@@ -261,34 +296,38 @@ class AspectProcessor:
     def __init__(self, registry: Dict[str, Any], utility_builder: UtilityFunctionBuilder):
         self.registry = registry
         self.utility_builder = utility_builder
+        self.logger = get_logger("lineagentic.registry.generators")
     
     def create_processors(self) -> Dict[str, Callable]:
         """Create aspect processor functions from registry definitions"""
         def process_aspect(name: str, aspect: Dict[str, Any]) -> Callable:
+            # Kept fields are fixed per aspect, so the membership test per key is one frozenset lookup
+            properties = aspect.get(properties_field, [])
+            kept_fields = frozenset(properties).difference(context_exclude_fields)
+            
             def aspect_processor(payload: Dict[str, Any]) -> Dict[str, Any]:
-                aspect_context_config = self.registry.get('aspect_context_config', {})
-                aspect_field = aspect_context_config.get('aspect_field', 'aspect')
-                
                 context = payload.copy()
                 context[aspect_field] = aspect
                 
                 for field_name, field_value in aspect.items():
-                    self._process_field_generically(field_name, field_value, context, self.utility_builder.create_functions())
-                
-                aspect_config = self.registry.get('aspect_processing', {})
-                properties_field = aspect_config.get('properties_field', 'properties')
-                context_exclude_fields = aspect_config.get('context_exclude_fields', ['aspect'])
+                    self._process_field_generically(field_name, field_value, context, utils)
                 
-                properties = aspect.get(properties_field, [])
-                filtered_payload = {k: v for k, v in context.items() 
-                                  if k in properties and k not in context_exclude_fields}
+                filtered_payload = {k: v for k, v in context.items() if k in kept_fields}
                 
                 return filtered_payload
             
             return aspect_processor
         
+        aspect_context_config = self.registry.get('aspect_context_config', {})
+        aspect_field = aspect_context_config.get('aspect_field', 'aspect')
+        aspect_config = self.registry.get('aspect_processing', {})
+        properties_field = aspect_config.get('properties_field', 'properties')
+        context_exclude_fields = aspect_config.get('context_exclude_fields', ['aspect'])
+        
         section_config = self.registry.get('section_config', {})
         aspects_section = section_config.get('aspects_section', 'aspects')
+        # Build the utility functions once instead of per field on every payload
+        utils = self.utility_builder.create_functions()
         
         processors = {}
         if aspects_section in self.registry:
@@ -328,5 +367,5 @@ class AspectProcessor:
             else:
                 context[f'field_{field_name}'] = field_value
         except Exception as e:
-            print(f"Error processing aspect field '{field_name}' with value {field_value}: {e}")
+            log_error_with_context(self.logger, e, "aspect field processing", field_name=field_name, field_value=field_value)
             raise 
\ No newline at end of file
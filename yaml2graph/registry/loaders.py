@@ -1,12 +1,22 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import copy
 import os
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 import yaml
 import importlib.resources
 
+try:
+    # libyaml-backed loader; same safe semantics, much faster parsing
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+# Parsed YAML documents keyed by file identity, shared by every loader in the process
+_PARSED_YAML_CACHE: Dict[Tuple[Any, ...], Any] = {}
+
 
 class RegistryLoader:
     """Handles loading and merging registry configuration files"""
@@ -29,15 +39,22 @@ class RegistryLoader:
         """Load a single YAML file"""
         # First try to load from local file system
         if os.path.exists(file_path):
-            with open(file_path, 'r') as f:
-                return yaml.safe_load(f)
+            stat = os.stat(file_path)
+            cache_key = (os.path.realpath(file_path), stat.st_mtime_ns, stat.st_size)
+            if cache_key not in _PARSED_YAML_CACHE:
+                with open(file_path, 'rb') as f:
+                    _PARSED_YAML_CACHE[cache_key] = yaml.load(f, Loader=_SafeLoader)
+            return copy.deepcopy(_PARSED_YAML_CACHE[cache_key])
         
         # If not found locally, try to load from installed package
         try:
             # Try to load from the package's config directory using importlib.resources
             config_file_name = Path(file_path).name
-            with importlib.resources.files('yaml2graph').joinpath('config', config_file_name).open('r') as f:
-                return yaml.safe_load(f)
+            cache_key = ('yaml2graph', 'config', config_file_name)
+            if cache_key not in _PARSED_YAML_CACHE:
+                with importlib.resources.files('yaml2graph').joinpath('config', config_file_name).open('rb') as f:
+                    _PARSED_YAML_CACHE[cache_key] = yaml.load(f, Loader=_SafeLoader)
+            return copy.deepcopy(_PARSED_YAML_CACHE[cache_key])
         except Exception:
             pass
         
@@ -45,7 +62,8 @@ class RegistryLoader:
     
     def _merge_configurations(self, main_registry: Dict[str, Any]) -> Dict[str, Any]:
         """Merge main registry with additional configuration files"""
-        merged = main_registry.copy()
+        # Loaded documents are private copies, so includes are merged into the main registry in place
+        merged = main_registry
         
         # Check for includes in main registry
         includes = main_registry.get('includes', [])
@@ -71,13 +89,12 @@ class RegistryLoader:
         return merged
     
     def _deep_merge(self, base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
-        """Deep merge two dictionaries"""
-        result = base.copy()
-        
+        """Deep merge override into base in place and return base"""
         for key, value in override.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = self._deep_merge(result[key], value)
+            current = base.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                self._deep_merge(current, value)
             else:
-                result[key] = value
+                base[key] = value
         
-        return result
+        return base
@@ -1,7 +1,11 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
-from typing import Any, Dict, List
+import re
+from typing import Any, Dict, List, Set
+
+_TEMPLATE_PARAM_RE = re.compile(r'\{([^}]+)\}')
+_CAMEL_BOUNDARY_RE = re.compile(r'([a-z0-9])([A-Z])')
 
 
 class RegistryValidator:
@@ -39,36 +43,37 @@ class RegistryValidator:
             dependencies = pattern_def.get('dependencies', [])
             
             # Simple template parameter validation
-            import re
-            template_params = re.findall(r'\{([^}]+)\}', template)
+            template_params = _TEMPLATE_PARAM_RE.findall(template)
+            conditional_logic = pattern_def.get('conditional_logic')
+            dependency_params = None
             for param in template_params:
-                if param not in parameters and param != 'prefix':
-                    # Check if this is a conditional logic field
-                    conditional_logic = pattern_def.get('conditional_logic')
-                    if param == conditional_logic:
-                        continue  # Skip validation for conditional logic fields
-                    
-                    # Check if this is a dependency-generated parameter
-                    is_dependency_param = False
-                    for dep in dependencies:
-                        if dep in urn_patterns:
-                            dep_params = urn_patterns[dep].get('parameters', [])
-                            for dep_param in dep_params:
-                                # Convert dependency parameter to expected format (e.g., platform -> data_platform_urn)
-                                if param == f"{dep_param}_urn" or param == f"{dep}_urn":
-                                    is_dependency_param = True
-                                    break
-                            # Also check for camelCase to snake_case conversion (e.g., dataPlatform -> data_platform_urn)
-                            if not is_dependency_param:
-                                import re
-                                # Convert camelCase to snake_case
-                                snake_case_dep = re.sub(r'([a-z0-9])([A-Z])', r'\1_\2', dep).lower()
-                                if param == f"{snake_case_dep}_urn":
-                                    is_dependency_param = True
-                                    break
-                    
-                    if not is_dependency_param:
-                        raise ValueError(f"Template parameter '{param}' not defined in parameters for pattern '{pattern_name}'")
+                if param in parameters or param == 'prefix':
+                    continue
+                # Skip validation for conditional logic fields
+                if param == conditional_logic:
+                    continue
+                
+                # Check if this is a dependency-generated parameter
+                if dependency_params is None:
+                    dependency_params = self._dependency_urn_params(dependencies, urn_patterns)
+                if param not in dependency_params:
+                    raise ValueError(f"Template parameter '{param}' not defined in parameters for pattern '{pattern_name}'")
+    
+    def _dependency_urn_params(self, dependencies: List[str], urn_patterns: Dict[str, Any]) -> Set[str]:
+        """Collect template parameter names that URN dependencies can provide"""
+        dependency_params = set()
+        for dep in dependencies:
+            if dep not in urn_patterns:
+                continue
+            dep_params = urn_patterns[dep].get('parameters', [])
+            # Dependency parameter in expected format (e.g., platform -> platform_urn)
+            dependency_params.update(f"{dep_param}_urn" for dep_param in dep_params)
+            if dep_params:
+                dependency_params.add(f"{dep}_urn")
+            # camelCase to snake_case conversion (e.g., dataPlatform -> data_platform_urn)
+            snake_case_dep = _CAMEL_BOUNDARY_RE.sub(r'\1_\2', dep).lower()
+            dependency_params.add(f"{snake_case_dep}_urn")
+        return dependency_params
     
     def _validate_aspects(self, registry: Dict[str, Any]) -> None:
         """Validate aspect definitions"""
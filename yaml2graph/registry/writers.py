@@ -3,8 +3,50 @@ from __future__ import annotations
 
 import json
 import re
-from typing import Any, Dict, Type, Callable, List
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from typing import Any, Dict, Type, Callable, Iterable, Iterator, List, Optional
 from neo4j import GraphDatabase
+from neo4j.exceptions import ClientError
+
+from ..utils.logging_config import get_logger
+
+try:
+    from orjson import dumps as _orjson_dumps, loads as _json_loads
+    
+    def _json_dumps(obj: Any) -> str:
+        """Serialize an aspect payload with orjson, falling back to json for types it rejects"""
+        try:
+            return _orjson_dumps(obj).decode()
+        except TypeError:  # e.g. non-str keys or integers beyond 64 bits
+            return json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
+except ImportError:  # orjson is optional; stored payloads are plain JSON either way
+    _json_loads = json.loads
+    
+    def _json_dumps(obj: Any) -> str:
+        """Serialize an aspect payload, compact like orjson so stored JSON does not depend on the backend"""
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
+
+# Rows sent per UNWIND statement by the batch write methods
+BATCH_SIZE = 1000
+
+# Template URN parameter that receives the related field value, per entity type
+_TEMPLATE_VALUE_PARAMS = {'CorpUser': 'username', 'CorpGroup': 'name', 'Column': 'field_path'}
+# Template URN parameter that receives the owning entity's URN, per entity type
+_TEMPLATE_PARENT_PARAMS = {'Column': 'dataset_urn'}
+
+
+class _CheckpointedTransaction:
+    """Handle yielded by transaction(commit_every=...); each run goes to the transaction that is current after checkpoints"""
+    
+    def __init__(self, writer):
+        self._writer = writer
+    
+    def run(self, query: str, parameters: Dict[str, Any]|None = None, **kwargs):
+        # Counts toward commit_every like writer calls; consume the result before the next checkpoint commits it away
+        return self._writer._bound_tx().run(query, parameters, **kwargs)
 
 
 class Neo4jWriterGenerator:
@@ -22,12 +64,25 @@ class Neo4jWriterGenerator:
         
         class DynamicNeo4jMetadataWriter:
             def __init__(self, uri: str, user: str, password: str, registry: Dict[str, Any], 
-                         urn_generators: Dict[str, Callable], utility_functions: Dict[str, Callable], registry_factory):
-                self._driver = GraphDatabase.driver(uri, auth=(user, password))
+                         urn_generators: Dict[str, Callable], utility_functions: Dict[str, Callable], registry_factory,
+                         **driver_config: Any):
+                self.logger = get_logger("lineagentic.registry.writer")
+                # driver_config goes straight to the Neo4j driver (pool size, acquisition timeout, keep-alive, ...)
+                self._driver = GraphDatabase.driver(uri, auth=(user, password), **driver_config)
+                # Managed single-statement path, available from neo4j 5.5
+                self._execute_query = getattr(self._driver, 'execute_query', None)
+                self._local = threading.local()
                 self.registry = registry
                 self.urn_generators = urn_generators
                 self.utility_functions = utility_functions
                 self.registry_factory = registry_factory
+                # Allowed (entity label, aspect) -> kind pairs and the defined aspects, checked on every aspect write
+                self._aspect_kinds = {
+                    (label, aspect): kind
+                    for label, ent in registry.get("entities", {}).items()
+                    for aspect, kind in ent.get("aspects", {}).items()
+                }
+                self._defined_aspects = frozenset(registry.get("aspects", {}))
                 
                 # Generate all methods from registry
                 self._generate_entity_methods()
@@ -38,6 +93,95 @@ class Neo4jWriterGenerator:
             def close(self):
                 self._driver.close()
             
+            def __enter__(self):
+                return self
+            
+            def __exit__(self, exc_type, exc, tb):
+                self.close()
+                return False
+            
+            @contextmanager
+            def session(self):
+                """Reuse one Neo4j session for every writer call made inside the block"""
+                # Inside transaction() the transaction already pins the work to one session
+                bound = self._tx_handle() or getattr(self._local, 'session', None)
+                if bound is not None:
+                    yield bound
+                    return
+                with self._driver.session() as s:
+                    self._local.session = s
+                    try:
+                        yield s
+                    finally:
+                        self._local.session = None
+            
+            @contextmanager
+            def transaction(self, commit_every: int|None = None):
+                """Run every writer call inside the block in one transaction, committed on exit and every commit_every operations"""
+                # Checkpoints keep long runs' transaction state bounded; a failure rolls back only work since the last one
+                bound = self._tx_handle()
+                if bound is not None:
+                    yield bound
+                    return
+                with self._session() as s:
+                    self._local.tx = s.begin_transaction()
+                    self._local.tx_session, self._local.commit_every, self._local.tx_ops = s, commit_every, 0
+                    try:
+                        yield self._tx_handle()
+                        self._local.tx.commit()
+                    except Exception:
+                        self._local.tx.rollback()
+                        raise
+                    finally:
+                        self._local.tx.close()
+                        self._local.tx = None
+            
+            def _tx_handle(self):
+                """Return what transaction() hands to callers: the bound transaction, or a checkpoint-aware proxy for it"""
+                tx = getattr(self._local, 'tx', None)
+                if tx is not None and self._local.commit_every:
+                    # The underlying transaction is replaced at every checkpoint, so callers must not hold it
+                    return _CheckpointedTransaction(self)
+                return tx
+            
+            def _bound_tx(self):
+                """Return the bound transaction, committing and reopening it once it reaches its commit size"""
+                tx = getattr(self._local, 'tx', None)
+                if tx is not None and self._local.commit_every:
+                    if self._local.tx_ops >= self._local.commit_every:
+                        tx.commit()
+                        tx.close()
+                        tx = self._local.tx = self._local.tx_session.begin_transaction()
+                        self._local.tx_ops = 0
+                    self._local.tx_ops += 1
+                return tx
+            
+            @contextmanager
+            def _session(self):
+                """Yield the bound transaction or session, or a short-lived session"""
+                bound = self._bound_tx() or getattr(self._local, 'session', None)
+                if bound is not None:
+                    yield bound
+                    return
+                with self._driver.session() as s:
+                    yield s
+            
+            def _run(self, query: str, read: bool = False, **params) -> List[Any]:
+                """Run one statement in the bound transaction or session, or through the driver's managed execute_query"""
+                if (self._execute_query is not None and getattr(self._local, 'tx', None) is None
+                        and getattr(self._local, 'session', None) is None):
+                    return self._execute_query(query, parameters_=params, routing_='r' if read else 'w').records
+                with self._session() as s:
+                    return list(s.run(query, **params))
+            
+            def _execute_write(self, work: Callable) -> Any:
+                """Run a unit of work in the bound transaction, or in its own managed write transaction"""
+                tx = self._bound_tx()
+                if tx is not None:
+                    return work(tx)
+                with self._session() as s:
+                    return s.execute_write(work)
+            
             def _generate_entity_methods(self):
                 """Generate entity-specific methods from registry"""
                 section_config = self.registry.get('section_config', {})
@@ -46,24 +190,62 @@ class Neo4jWriterGenerator:
                 urn_generator_field = entity_config.get('urn_generator_field', 'urn_generator')
                 properties_field = entity_config.get('properties_field', 'properties')
                 
+                self._upsert_queries = {}
                 for entity_name, entity_def in self.registry.get(entities_section, {}).items():
                     urn_gen_name = entity_def.get(urn_generator_field)
                     if urn_gen_name and urn_gen_name in self.urn_generators:
                         urn_gen = self.urn_generators[urn_gen_name]
+                        # Specialize this entity type's Cypher now rather than formatting it on every write
+                        self._entity_upsert_queries(entity_name)
                         
                         # Generate upsert method
-                        def create_upsert_method(entity_name, urn_gen, entity_def):
+                        # Registry properties are fixed once the writer is built
+                        properties = frozenset(entity_def.get(properties_field, []))
+                        
+                        def create_upsert_method(entity_name, urn_gen, properties):
                             def upsert_method(**kwargs):
                                 urn = urn_gen(**kwargs)
-                                props = {k: v for k, v in kwargs.items() if k in entity_def.get(properties_field, [])}
-                                self._upsert_entity_generic(entity_name, urn, props)
-                                # Discover relationships from entity creation
-                                self.discover_relationships_from_entity(entity_name, urn, props)
+                                # Usually every argument is a property; the C-level subset check skips the per-key filter
+                                props = kwargs if properties.issuperset(kwargs) else {k: v for k, v in kwargs.items() if k in properties}
+                                # One session for the node MERGE and the relationships it implies
+                                with self.session():
+                                    self._upsert_entity_generic(entity_name, urn, props)
+                                    # Discover relationships from entity creation
+                                    self.discover_relationships_from_entity(entity_name, urn, props)
                                 return urn
                             return upsert_method
                         
                         method_name = f"upsert_{entity_name.lower()}"
-                        setattr(self, method_name, create_upsert_method(entity_name, urn_gen, entity_def))
+                        setattr(self, method_name, create_upsert_method(entity_name, urn_gen, properties))
+                        
+                        # Generate batch upsert method
+                        def create_upsert_batch_method(entity_name, urn_gen, properties):
+                            def upsert_batch_method(records: Iterable[Dict[str, Any]], max_workers: Optional[int] = None) -> List[str]:
+                                """Upsert many entities; atomic only up to BATCH_SIZE rows, beyond that each chunk commits on its own and relationships follow"""
+                                # One pass over the records builds the rows and queues their relationships
+                                rows, urns, pending = [], [], {}
+                                for kwargs in records:
+                                    urn = urn_gen(**kwargs)
+                                    props = kwargs if properties.issuperset(kwargs) else {k: v for k, v in kwargs.items() if k in properties}
+                                    rows.append({'urn': urn, 'props': props})
+                                    urns.append(urn)
+                                    self.discover_relationships_from_entity(entity_name, urn, props, pending)
+                                started = time.perf_counter()
+                                # Fold repeated URNs first, so atomicity is decided on the nodes actually written
+                                merged = self._fold_entity_rows(rows)
+                                # A batch that fits one chunk commits its nodes and relationships together;
+                                # larger batches commit chunk by chunk, on max_workers sessions when asked
+                                with self.transaction() if len(merged) <= BATCH_SIZE else nullcontext():
+                                    self._upsert_entities_batch_generic(entity_name, merged, max_workers)
+                                    # Relationships discovered for the whole batch are written together, after their nodes
+                                    self._flush_relationships_generic(pending)
+                                self.logger.info(f"Batch {entity_name}: {len(rows)} rows in {(time.perf_counter() - started) * 1000:.0f}ms",
+                                                 entity_type=entity_name, rows=len(rows))
+                                return urns
+                            return upsert_batch_method
+                        
+                        method_name = f"upsert_{entity_name.lower()}_batch"
+                        setattr(self, method_name, create_upsert_batch_method(entity_name, urn_gen, properties))
                         
                         # Generate get method
                         def create_get_method(entity_name):
@@ -91,10 +273,22 @@ class Neo4jWriterGenerator:
                 rules_field = relationship_config.get('rules_field', 'rules')
                 entity_type_field = relationship_config.get('entity_type_field', 'entity_type')
                 
-                def discover_relationships_from_aspect(self, entity_urn: str, entity_type: str, aspect_name: str, aspect_data: Dict[str, Any]):
+                # Index rules once by what selects them, instead of scanning every rule on each write
+                aspect_rules_by_type: Dict[tuple, List[Dict[str, Any]]] = {}
+                creation_rules_by_type: Dict[str, List[tuple]] = {}
+                for aspect_name, aspect_rules in self.registry.get(aspect_relationships_section, {}).items():
+                    for rule in (aspect_rules or {}).get(rules_field, []):
+                        rule_entity_type = rule.get(entity_type_field)
+                        aspect_rules_by_type.setdefault((aspect_name, rule_entity_type), []).append(rule)
+                        if aspect_name.endswith('Creation'):  # Only process entity creation relationships
+                            creation_rules_by_type.setdefault(rule_entity_type, []).append((aspect_name, rule))
+                
+                def discover_relationships_from_aspect(self, entity_urn: str, entity_type: str, aspect_name: str, aspect_data: Dict[str, Any],
+                                                       pending: Dict[tuple, List[Dict[str, Any]]]|None = None):
                     """Discover and create relationships from aspect data using YAML-driven rules"""
-                    aspect_rules = self.registry.get(aspect_relationships_section, {}).get(aspect_name)
-                    if not aspect_rules:
+                    # Skip the entity round trip and data merge when no rule applies to this entity type
+                    rules = aspect_rules_by_type.get((aspect_name, entity_type))
+                    if not rules:
                         return
                     
                     # Get entity properties to include in relationship discovery
@@ -105,29 +299,47 @@ class Neo4jWriterGenerator:
                     else:
                         combined_data = aspect_data
                     
-                    for rule in aspect_rules.get(rules_field, []):
-                        if rule.get(entity_type_field) == entity_type:
-                            self._apply_relationship_rule_generic(entity_urn, entity_type, combined_data, rule)
+                    # A caller-supplied pending map defers the write, as for entity discovery
+                    with self._pending_relationships(pending) as pending:
+                        for rule in rules:
+                            self._apply_relationship_rule_generic(entity_urn, entity_type, combined_data, rule, pending)
                 
                 setattr(self, 'discover_relationships_from_aspect', discover_relationships_from_aspect.__get__(self))
                 
-                def discover_relationships_from_entity(self, entity_type: str, entity_urn: str, entity_props: Dict[str, Any]):
+                def discover_relationships_from_entity(self, entity_type: str, entity_urn: str, entity_props: Dict[str, Any],
+                                                       pending: Dict[tuple, List[Dict[str, Any]]]|None = None):
                     """Discover and create relationships from entity properties using YAML-driven rules"""
-                    print(f"🔍 Discovering relationships for entity {entity_type}:{entity_urn}")
-                    print(f"🔍 Entity properties: {entity_props}")
+                    rules = creation_rules_by_type.get(entity_type)
+                    if not rules:
+                        return
+                    self.logger.debug("Discovering relationships for entity", entity_type=entity_type, entity_urn=entity_urn)
                     
-                    # Look for entity creation relationships (not aspect-driven)
-                    for aspect_name, aspect_rules in self.registry.get(aspect_relationships_section, {}).items():
-                        print(f"🔍 Checking aspect: {aspect_name}, ends with 'Creation': {aspect_name.endswith('Creation')}")
-                        if aspect_name.endswith('Creation'):  # Only process entity creation relationships
-                            print(f"🔍 Processing entity creation rule: {aspect_name}")
-                            for rule in aspect_rules.get(rules_field, []):
-                                print(f"🔍 Rule entity_type: {rule.get(entity_type_field)}, target: {entity_type}")
-                                if rule.get(entity_type_field) == entity_type:
-                                    print(f"🔍 Applying entity relationship rule for {entity_type}")
-                                    self._apply_relationship_rule_generic(entity_urn, entity_type, entity_props, rule)
+                    # Look for entity creation relationships (not aspect-driven); a caller-supplied pending map defers the write
+                    with self._pending_relationships(pending) as pending:
+                        for aspect_name, rule in rules:
+                            self.logger.debug("Applying entity relationship rule", rule=aspect_name, entity_type=entity_type)
+                            self._apply_relationship_rule_generic(entity_urn, entity_type, entity_props, rule, pending)
                 
                 setattr(self, 'discover_relationships_from_entity', discover_relationships_from_entity.__get__(self))
+                
+                # Bind each entity type to its URN resolution strategy so relationship targets skip the registry walk
+                def make_urn_resolver(entity_type, urn_pattern):
+                    strategy = urn_pattern.get('resolution_strategy', 'template')
+                    if strategy == 'direct':
+                        return lambda value, urn_field, data, entity_urn: self._resolve_direct_urn(value, entity_type, urn_pattern, entity_urn)
+                    if strategy == 'template':
+                        return lambda value, urn_field, data, entity_urn: self._resolve_template_urn(value, entity_type, urn_pattern, data, entity_urn)
+                    if strategy == 'lookup':
+                        return lambda value, urn_field, data, entity_urn: self._resolve_lookup_urn(value, entity_type, urn_field, data)
+                    return None
+                
+                urn_patterns = self.registry.get('urn_patterns', {})
+                self._urn_resolvers = {}
+                for entity_type, entity_def in self.registry.get('entities', {}).items():
+                    urn_pattern = urn_patterns.get((entity_def or {}).get('urn_generator'))
+                    resolver = make_urn_resolver(entity_type, urn_pattern) if urn_pattern else None
+                    if resolver is not None:
+                        self._urn_resolvers[entity_type] = resolver
             
             def _generate_aspect_methods(self):
                 """Generate aspect-specific methods from registry"""
@@ -136,57 +348,54 @@ class Neo4jWriterGenerator:
                 aspect_config = self.registry.get('aspect_config', {})
                 type_field = aspect_config.get('type_field', 'type')
                 entity_creation_field = aspect_config.get('entity_creation_field', 'entity_creation')
+                # Payload properties per aspect, read once for extracting payloads from entity params
+                self._aspect_properties = {}
                 
                 for aspect_name, aspect_def in self.registry.get(aspects_section, {}).items():
                     aspect_type = aspect_def[type_field]
                     entity_creation = aspect_def.get(entity_creation_field)
+                    self._aspect_properties[aspect_name] = tuple(aspect_def.get('properties', ()))
                     
                     # Generate upsert method with independent ingestion support
                     def create_upsert_aspect_method(aspect_name, aspect_type, entity_creation):
                         if aspect_type == 'versioned':
                             def aspect_method(entity_label: str = None, entity_urn: str = None, payload: Dict[str, Any] = None, version: int|None=None, **entity_params) -> int:
-                                if entity_urn is None and entity_creation:
-                                    entity_urn = self._create_entity_if_needed(entity_creation, entity_params)
-                                    entity_label = entity_creation['entity_type']
-                                elif entity_urn is None:
-                                    raise ValueError(f"entity_urn is required for aspect {aspect_name}")
-                                
-                                # If payload is None, extract it from entity_params
-                                if payload is None:
-                                    # Get aspect properties from registry
-                                    aspect_properties = self.registry.get('aspects', {}).get(aspect_name, {}).get('properties', [])
-                                    payload = {}
-                                    for prop in aspect_properties:
-                                        if prop in entity_params:
-                                            payload[prop] = entity_params[prop]
-                                
-                                result = self._upsert_versioned_aspect_generic(entity_label, entity_urn, aspect_name, payload, version)
-                                self.discover_relationships_from_aspect(entity_urn, entity_label, aspect_name, payload)
-                                return result
+                                # Entity creation, the aspect write and relationship discovery share one session
+                                with self.session():
+                                    entity_label, entity_urn, payload = self._prepare_aspect_call(aspect_name, entity_creation, entity_label, entity_urn, payload, entity_params)
+                                    result = self._upsert_versioned_aspect_generic(entity_label, entity_urn, aspect_name, payload, version)
+                                    self.discover_relationships_from_aspect(entity_urn, entity_label, aspect_name, payload)
+                                    return result
                         else:  # timeseries
                             def aspect_method(entity_label: str = None, entity_urn: str = None, payload: Dict[str, Any] = None, timestamp_ms: int|None=None, **entity_params) -> None:
-                                if entity_urn is None and entity_creation:
-                                    entity_urn = self._create_entity_if_needed(entity_creation, entity_params)
-                                    entity_label = entity_creation['entity_type']
-                                elif entity_urn is None:
-                                    raise ValueError(f"entity_urn is required for aspect {aspect_name}")
-                                
-                                # If payload is None, extract it from entity_params
-                                if payload is None:
-                                    # Get aspect properties from registry
-                                    aspect_properties = self.registry.get('aspects', {}).get(aspect_name, {}).get('properties', [])
-                                    payload = {}
-                                    for prop in aspect_properties:
-                                        if prop in entity_params:
-                                            payload[prop] = entity_params[prop]
-                                
-                                self._append_timeseries_aspect_generic(entity_label, entity_urn, aspect_name, payload, timestamp_ms)
-                                self.discover_relationships_from_aspect(entity_urn, entity_label, aspect_name, payload)
+                                # Entity creation, the aspect write and relationship discovery share one session
+                                with self.session():
+                                    entity_label, entity_urn, payload = self._prepare_aspect_call(aspect_name, entity_creation, entity_label, entity_urn, payload, entity_params)
+                                    self._append_timeseries_aspect_generic(entity_label, entity_urn, aspect_name, payload, timestamp_ms)
+                                    self.discover_relationships_from_aspect(entity_urn, entity_label, aspect_name, payload)
                         return aspect_method
                     
                     method_name = f"upsert_{aspect_name.lower()}_aspect"
                     setattr(self, method_name, create_upsert_aspect_method(aspect_name, aspect_type, entity_creation))
                     
+                    # Generate batch upsert method
+                    def create_upsert_aspect_batch_method(aspect_name, aspect_type):
+                        write_batch = (self._upsert_versioned_aspects_batch_generic if aspect_type == 'versioned'
+                                       else self._append_timeseries_aspects_batch_generic)
+                        
+                        def aspect_batch_method(entity_label: str, records: Iterable[Dict[str, Any]]) -> None:
+                            # Records carry entity_urn, payload and an optional version or timestamp_ms
+                            records = list(records)
+                            with self.session():
+                                write_batch(entity_label, aspect_name, records)
+                                with self._pending_relationships() as pending:
+                                    for record in records:
+                                        self.discover_relationships_from_aspect(record['entity_urn'], entity_label, aspect_name, record['payload'], pending)
+                        return aspect_batch_method
+                    
+                    method_name = f"upsert_{aspect_name.lower()}_aspect_batch"
+                    setattr(self, method_name, create_upsert_aspect_batch_method(aspect_name, aspect_type))
+                    
                     # Generate get method
                     def create_get_aspect_method(aspect_name, aspect_type):
                         if aspect_type == 'versioned':
@@ -209,88 +418,155 @@ class Neo4jWriterGenerator:
                     method_name = f"delete_{aspect_name.lower()}_aspect"
                     setattr(self, method_name, create_delete_aspect_method(aspect_name))
             
+            def create_indexes(self) -> None:
+                """Create urn uniqueness constraints and lookup indexes the writer matches nodes by; safe to call repeatedly"""
+                section_config = self.registry.get('section_config', {})
+                entities = self.registry.get(section_config.get('entities_section', 'entities'), {})
+                with self._driver.session() as s:
+                    # Schema commands cannot join a data transaction, so they always use their own session
+                    for label, prop in self._index_keys_generic(entities):
+                        if prop == 'urn':
+                            # A unique constraint is backed by an index and also stops concurrent MERGEs duplicating a node
+                            try:
+                                s.run(f"CREATE CONSTRAINT IF NOT EXISTS FOR (n:{label}) REQUIRE n.urn IS UNIQUE").consume()
+                                continue
+                            except ClientError as e:
+                                # e.g. an older plain urn index or duplicate nodes already in the graph
+                                self.logger.warning(f"Could not create urn constraint for {label}, using an index", error=str(e))
+                        try:
+                            s.run(f"CREATE INDEX IF NOT EXISTS FOR (n:{label}) ON (n.{prop})").consume()
+                        except ClientError as e:
+                            # e.g. no schema privileges or a conflicting index; writes still work, just without it
+                            self.logger.warning(f"Could not create index on {label}.{prop}", error=str(e))
+                self.logger.debug("Ensured identity constraints and indexes", labels=list(entities))
+            
+            def _index_keys_generic(self, entities: Dict[str, Any]) -> List[tuple]:
+                """List (label, property) pairs used as node identity by writes and URN lookups"""
+                keys = [(label, 'urn') for label in entities]
+                
+                # Lookup-resolved relationship endpoints are matched on their mapped field rather than urn
+                section_config = self.registry.get('section_config', {})
+                rules_field = self.registry.get('relationship_config', {}).get('rules_field', 'rules')
+                rule_config = self.registry.get('relationship_rule_config', {})
+                field_mapping_field = rule_config.get('field_mapping_field', 'field_mapping')
+                endpoints = (
+                    (rule_config.get('source_entity_type_name', 'source_entity_type'), rule_config.get('source_urn_field_name', 'source_urn_field')),
+                    (rule_config.get('target_entity_type_name', 'target_entity_type'), rule_config.get('target_urn_field_name', 'target_urn_field')),
+                )
+                urn_patterns = self.registry.get('urn_patterns', {})
+                for aspect_rules in self.registry.get(section_config.get('aspect_relationships_section', 'aspect_relationships'), {}).values():
+                    for rule in (aspect_rules or {}).get(rules_field, []):
+                        field_mapping = rule.get(field_mapping_field, {})
+                        for type_name, field_name in endpoints:
+                            label, prop = field_mapping.get(type_name), field_mapping.get(field_name)
+                            urn_pattern = urn_patterns.get(entities.get(label, {}).get('urn_generator'), {})
+                            if prop and urn_pattern.get('resolution_strategy') == 'lookup' and (label, prop) not in keys:
+                                keys.append((label, prop))
+                return keys
+            
             def _generate_utility_methods(self):
                 """Generate utility methods from utility functions"""
                 for func_name, func in self.utility_functions.items():
                     setattr(self, func_name, func)
             
             # Core generic methods
-            def _upsert_entity_generic(self, label: str, urn: str, props: Dict[str, Any]) -> None:
-                """Generic entity upsert method"""
-                props = {k: v for k, v in props.items() if v is not None}
-                with self._driver.session() as s:
-                    s.run(
+            def _entity_upsert_queries(self, label: str) -> tuple:
+                """Single-row and UNWIND upsert Cypher for a label, built once per label"""
+                queries = self._upsert_queries.get(label)
+                if queries is None:
+                    queries = self._upsert_queries[label] = (
                         f"""
                         MERGE (e:{label} {{urn:$urn}})
                         SET e += $props, e.lastUpdated=$now
                         """,
-                        urn=urn, props=props, now=self.utility_functions['utc_now_ms']()
+                        f"""
+                        UNWIND $rows AS row
+                        MERGE (e:{label} {{urn:row.urn}})
+                        SET e += row.props, e.lastUpdated=$now
+                        """,
                     )
+                return queries
+            
+            def _upsert_entity_generic(self, label: str, urn: str, props: Dict[str, Any]) -> None:
+                """Generic entity upsert method"""
+                props = {k: v for k, v in props.items() if v is not None}
+                self._run(
+                    self._entity_upsert_queries(label)[0],
+                    urn=urn, props=props, now=self.utility_functions['utc_now_ms']()
+                )
+            
+            @staticmethod
+            def _fold_entity_rows(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+                """Merge rows that share a URN, later non-None props winning, in first-seen order"""
+                merged = {}
+                for row in rows:
+                    merged.setdefault(row['urn'], {}).update((k, v) for k, v in row['props'].items() if v is not None)
+                return [{'urn': urn, 'props': props} for urn, props in merged.items()]
+            
+            def _upsert_entities_batch_generic(self, label: str, rows: List[Dict[str, Any]], max_workers: Optional[int] = None) -> None:
+                """Generic batched entity upsert; rows carry a unique 'urn' and 'props', written BATCH_SIZE per statement"""
+                chunks = [rows[start:start + BATCH_SIZE] for start in range(0, len(rows), BATCH_SIZE)]
+                now = self.utility_functions['utc_now_ms']()
+                query = self._entity_upsert_queries(label)[1]
+                
+                def write_chunk(chunk):
+                    # Each chunk commits as one managed (retryable) write transaction
+                    self._execute_write(lambda tx: tx.run(query, rows=chunk, now=now).consume())
+                
+                # A bound session or transaction is one unit of work, so chunks stay on it in order
+                bound = getattr(self._local, 'tx', None) or getattr(self._local, 'session', None)
+                if bound is not None or len(chunks) < 2 or (max_workers or 1) < 2:
+                    for chunk in chunks:
+                        write_chunk(chunk)
+                    return
+                with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as pool:
+                    list(pool.map(write_chunk, chunks))
             
             def _get_entity_generic(self, label: str, urn: str) -> Dict[str, Any]:
                 """Generic entity get method"""
-                with self._driver.session() as s:
-                    result = s.run(
-                        f"""
-                        MATCH (e:{label} {{urn:$urn}})
-                        RETURN e
-                        """,
-                        urn=urn
-                    )
-                    record = result.single()
-                    return dict(record['e']) if record else None
+                records = self._run(
+                    f"""
+                    MATCH (e:{label} {{urn:$urn}})
+                    RETURN e
+                    """,
+                    urn=urn, read=True
+                )
+                record = records[0] if records else None
+                return dict(record['e']) if record else None
             
             def _delete_entity_generic(self, label: str, urn: str) -> None:
                 """Generic entity delete method"""
-                with self._driver.session() as s:
-                    s.run(
-                        f"""
-                        MATCH (e:{label} {{urn:$urn}})
-                        DETACH DELETE e
-                        """,
-                        urn=urn
-                    )
+                self._run(
+                    f"""
+                    MATCH (e:{label} {{urn:$urn}})
+                    DETACH DELETE e
+                    """,
+                    urn=urn
+                )
             
             def _create_relationship_generic(self, from_label: str, from_urn: str, rel: str,
                                           to_label: str, to_urn: str, props: Dict[str, Any]|None=None) -> None:
                 """Generic relationship creation method"""
                 props = props or {}
-                with self._driver.session() as s:
-                    s.run(
-                        f"""
-                        MATCH (a:{from_label} {{urn:$from_urn}})
-                        MATCH (b:{to_label} {{urn:$to_urn}})
-                        MERGE (a)-[r:{rel}]->(b)
-                        SET r += $props
-                        """,
-                        from_urn=from_urn, to_urn=to_urn, props=props
-                    )
+                self._run(
+                    f"""
+                    MATCH (a:{from_label} {{urn:$from_urn}})
+                    MATCH (b:{to_label} {{urn:$to_urn}})
+                    MERGE (a)-[r:{rel}]->(b)
+                    SET r += $props
+                    """,
+                    from_urn=from_urn, to_urn=to_urn, props=props
+                )
             
             def _validate_aspect_generic(self, entity_label: str, aspect_name: str, kind: str):
                 """Validate aspect against registry"""
-                ents = self.registry.get("entities", {})
-                ent = ents.get(entity_label, {})
-                aspects = ent.get("aspects", {})
-                allowed = aspects.get(aspect_name)
+                allowed = self._aspect_kinds.get((entity_label, aspect_name))
                 if allowed != kind:
                     raise ValueError(f"Aspect '{aspect_name}' not allowed as '{kind}' on entity '{entity_label}' (registry says: {allowed})")
                 
-                if aspect_name not in self.registry.get("aspects", {}):
+                if aspect_name not in self._defined_aspects:
                     raise ValueError(f"Aspect '{aspect_name}' not defined in registry aspects section")
             
-            def _max_version_generic(self, entity_label: str, entity_urn: str, aspect_name: str) -> int:
-                """Get max version for versioned aspect"""
-                with self._driver.session() as s:
-                    res = s.run(
-                        f"""
-                        MATCH (e:{entity_label} {{urn:$urn}})-[:HAS_ASPECT {{name:$an}}]->(a:Aspect:Versioned)
-                        RETURN coalesce(max(a.version), -1) AS maxv
-                        """,
-                        urn=entity_urn, an=aspect_name
-                    )
-                    rec = res.single()
-                    return rec["maxv"] if rec else -1
-            
             def _upsert_versioned_aspect_generic(self, entity_label: str, entity_urn: str,
                                                aspect_name: str, payload: Dict[str, Any], version: int|None=None) -> int:
                 """Generic versioned aspect upsert method"""
@@ -298,28 +574,32 @@ class Neo4jWriterGenerator:
                 
                 validated_payload = self.registry_factory.validate_aspect_payload(aspect_name, payload)
                 
-                current_max = self._max_version_generic(entity_label, entity_urn, aspect_name)
-                new_version = current_max + 1 if version is None else version
-                aspect_id = f"{entity_urn}|{aspect_name}|{new_version}"
+                payload_json = _json_dumps(validated_payload)
+                now = self.utility_functions['utc_now_ms']()
                 
-                with self._driver.session() as s:
-                    s.run(
-                        f"""
-                        MATCH (e:{entity_label} {{urn:$urn}})-[r:HAS_ASPECT {{name:$an, kind:'versioned', latest:true}}]->(:Aspect)
-                        SET r.latest=false
-                        """,
-                        urn=entity_urn, an=aspect_name
-                    )
-                    s.run(
+                def write_aspect(tx):
+                    # Next version, clearing the previous latest flag and creating the new version in one statement;
+                    # latest is cleared on any aspect node, the version only counts versioned ones
+                    return tx.run(
                         f"""
                         MATCH (e:{entity_label} {{urn:$urn}})
-                        CREATE (a:Aspect:Versioned {{id:$id, name:$an, version:$ver, kind:'versioned', json:$json, createdAt:$now}})
-                        CREATE (e)-[:HAS_ASPECT {{name:$an, version:$ver, latest:true, kind:'versioned'}}]->(a)
+                        OPTIONAL MATCH (e)-[r:HAS_ASPECT {{name:$an}}]->(old:Aspect)
+                        WITH e, coalesce($ver, coalesce(max(CASE WHEN old:Versioned THEN old.version END), -1) + 1) AS version,
+                             collect(CASE WHEN r.kind = 'versioned' AND r.latest THEN r END) AS latest
+                        FOREACH (r IN latest | SET r.latest=false)
+                        CREATE (a:Aspect:Versioned {{id:$urn + '|' + $an + '|' + toString(version), name:$an, version:version, kind:'versioned', json:$json, createdAt:$now}})
+                        CREATE (e)-[:HAS_ASPECT {{name:$an, version:version, latest:true, kind:'versioned'}}]->(a)
+                        RETURN version
                         """,
-                        urn=entity_urn, id=aspect_id, an=aspect_name, ver=new_version,
-                        json=json.dumps(validated_payload, ensure_ascii=False), now=self.utility_functions['utc_now_ms']()
-                    )
-                return new_version
+                        urn=entity_urn, an=aspect_name, ver=version,
+                        json=payload_json, now=now
+                    ).single()
+                
+                rec = self._execute_write(write_aspect)
+                # No record means the entity does not exist and nothing was written
+                if rec is None:
+                    return 0 if version is None else version
+                return rec["version"]
             
             def _append_timeseries_aspect_generic(self, entity_label: str, entity_urn: str,
                                                 aspect_name: str, payload: Dict[str, Any], timestamp_ms: int|None=None) -> None:
@@ -331,73 +611,145 @@ class Neo4jWriterGenerator:
                 ts = timestamp_ms or self.utility_functions['utc_now_ms']()
                 aspect_id = f"{entity_urn}|{aspect_name}|{ts}"
                 
-                with self._driver.session() as s:
-                    s.run(
-                        f"""
-                        MATCH (e:{entity_label} {{urn:$urn}})
-                        CREATE (a:Aspect:TimeSeries {{id:$id, name:$an, ts:$ts, kind:'timeseries', json:$json, createdAt:$now}})
-                        CREATE (e)-[:HAS_ASPECT {{name:$an, ts:$ts, kind:'timeseries'}}]->(a)
-                        """,
-                        urn=entity_urn, id=aspect_id, an=aspect_name, ts=ts,
-                        json=json.dumps(validated_payload, ensure_ascii=False), now=self.utility_functions['utc_now_ms']()
-                    )
+                self._run(
+                    f"""
+                    MATCH (e:{entity_label} {{urn:$urn}})
+                    CREATE (a:Aspect:TimeSeries {{id:$id, name:$an, ts:$ts, kind:'timeseries', json:$json, createdAt:$now}})
+                    CREATE (e)-[:HAS_ASPECT {{name:$an, ts:$ts, kind:'timeseries'}}]->(a)
+                    """,
+                    urn=entity_urn, id=aspect_id, an=aspect_name, ts=ts,
+                    json=_json_dumps(validated_payload), now=self.utility_functions['utc_now_ms']()
+                )
+            
+            def _upsert_versioned_aspects_batch_generic(self, entity_label: str, aspect_name: str, records: List[Dict[str, Any]]) -> None:
+                """Generic batched versioned aspect upsert, BATCH_SIZE records per UNWIND statement"""
+                self._validate_aspect_generic(entity_label, aspect_name, "versioned")
+                process_payload = self.registry_factory.get_aspect_processor(aspect_name)
+                
+                # Each statement sees an entity at most once, so repeated URNs get consecutive versions across rounds
+                rounds: List[List[Dict[str, Any]]] = []
+                seen: Dict[str, int] = {}
+                for record in records:
+                    urn = record['entity_urn']
+                    n = seen.get(urn, 0)
+                    seen[urn] = n + 1
+                    if n == len(rounds):
+                        rounds.append([])
+                    rounds[n].append({
+                        'urn': urn, 'version': record.get('version'),
+                        'json': _json_dumps(process_payload(record['payload'])),
+                    })
+                now = self.utility_functions['utc_now_ms']()
+                query = f"""
+                    UNWIND $rows AS row
+                    MATCH (e:{entity_label} {{urn:row.urn}})
+                    OPTIONAL MATCH (e)-[r:HAS_ASPECT {{name:$an}}]->(old:Aspect)
+                    WITH row, e, coalesce(row.version, coalesce(max(CASE WHEN old:Versioned THEN old.version END), -1) + 1) AS version,
+                         collect(CASE WHEN r.kind = 'versioned' AND r.latest THEN r END) AS latest
+                    FOREACH (r IN latest | SET r.latest=false)
+                    CREATE (a:Aspect:Versioned {{id:row.urn + '|' + $an + '|' + toString(version), name:$an, version:version, kind:'versioned', json:row.json, createdAt:$now}})
+                    CREATE (e)-[:HAS_ASPECT {{name:$an, version:version, latest:true, kind:'versioned'}}]->(a)
+                    """
+                with self.session():
+                    for rows in rounds:
+                        for start in range(0, len(rows), BATCH_SIZE):
+                            chunk = rows[start:start + BATCH_SIZE]
+                            self._execute_write(lambda tx: tx.run(query, rows=chunk, an=aspect_name, now=now).consume())
+            
+            def _append_timeseries_aspects_batch_generic(self, entity_label: str, aspect_name: str, records: List[Dict[str, Any]]) -> None:
+                """Generic batched timeseries aspect append, BATCH_SIZE records per UNWIND statement"""
+                # The aspect is checked and its processor resolved once for the whole batch
+                self._validate_aspect_generic(entity_label, aspect_name, "timeseries")
+                process_payload = self.registry_factory.get_aspect_processor(aspect_name)
+                
+                now = self.utility_functions['utc_now_ms']()
+                rows = []
+                for record in records:
+                    validated_payload = process_payload(record['payload'])
+                    ts = record.get('timestamp_ms') or now
+                    rows.append({
+                        'urn': record['entity_urn'], 'id': f"{record['entity_urn']}|{aspect_name}|{ts}",
+                        'ts': ts, 'json': _json_dumps(validated_payload),
+                    })
+                query = f"""
+                    UNWIND $rows AS row
+                    MATCH (e:{entity_label} {{urn:row.urn}})
+                    CREATE (a:Aspect:TimeSeries {{id:row.id, name:$an, ts:row.ts, kind:'timeseries', json:row.json, createdAt:$now}})
+                    CREATE (e)-[:HAS_ASPECT {{name:$an, ts:row.ts, kind:'timeseries'}}]->(a)
+                    """
+                with self.session():
+                    for start in range(0, len(rows), BATCH_SIZE):
+                        chunk = rows[start:start + BATCH_SIZE]
+                        self._execute_write(lambda tx: tx.run(query, rows=chunk, an=aspect_name, now=now).consume())
             
             def _get_latest_aspect_generic(self, entity_label: str, entity_urn: str, aspect_name: str) -> Dict[str, Any]:
                 """Generic method to get latest version of an aspect"""
-                with self._driver.session() as s:
-                    result = s.run(
-                        f"""
-                        MATCH (e:{entity_label} {{urn:$urn}})-[r:HAS_ASPECT {{name:$an, kind:'versioned', latest:true}}]->(a:Aspect:Versioned)
-                        RETURN a.version as version, 
-                               a.json as payload, 
-                               a.createdAt as created_at
-                        """,
-                        urn=entity_urn, an=aspect_name
-                    )
-                    
-                    record = result.single()
-                    if record:
-                        return {
-                            'version': record['version'],
-                            'payload': json.loads(record['payload']) if record['payload'] else {},
-                            'created_at': record['created_at']
-                        }
-                    return None
+                records = self._run(
+                    f"""
+                    MATCH (e:{entity_label} {{urn:$urn}})-[r:HAS_ASPECT {{name:$an, kind:'versioned', latest:true}}]->(a:Aspect:Versioned)
+                    RETURN a.version as version, 
+                           a.json as payload, 
+                           a.createdAt as created_at
+                    """,
+                    urn=entity_urn, an=aspect_name, read=True
+                )
+                
+                record = records[0] if records else None
+                if record:
+                    return {
+                        'version': record['version'],
+                        'payload': _json_loads(record['payload']) if record['payload'] else {},
+                        'created_at': record['created_at']
+                    }
+                return None
             
             def _get_timeseries_aspect_generic(self, entity_label: str, entity_urn: str, aspect_name: str, limit: int = 100) -> List[Dict[str, Any]]:
                 """Generic method to get timeseries aspect data"""
-                with self._driver.session() as s:
-                    result = s.run(
-                        f"""
-                        MATCH (e:{entity_label} {{urn:$urn}})-[r:HAS_ASPECT {{name:$an, kind:'timeseries'}}]->(a:Aspect:TimeSeries)
-                        RETURN a.ts as timestamp, 
-                               a.json as payload, 
-                               a.createdAt as created_at
-                        ORDER BY a.ts DESC
-                        LIMIT $limit
-                        """,
-                        urn=entity_urn, an=aspect_name, limit=limit
-                    )
-                    
-                    timeseries_data = []
-                    for record in result:
-                        timeseries_data.append({
-                            'timestamp': record['timestamp'],
-                            'payload': json.loads(record['payload']) if record['payload'] else {},
-                            'created_at': record['created_at']
-                        })
-                    return timeseries_data
+                records = self._run(
+                    f"""
+                    MATCH (e:{entity_label} {{urn:$urn}})-[r:HAS_ASPECT {{name:$an, kind:'timeseries'}}]->(a:Aspect:TimeSeries)
+                    RETURN a.ts as timestamp, 
+                           a.json as payload, 
+                           a.createdAt as created_at
+                    ORDER BY a.ts DESC
+                    LIMIT $limit
+                    """,
+                    urn=entity_urn, an=aspect_name, limit=limit, read=True
+                )
+                
+                timeseries_data = []
+                for record in records:
+                    timeseries_data.append({
+                        'timestamp': record['timestamp'],
+                        'payload': _json_loads(record['payload']) if record['payload'] else {},
+                        'created_at': record['created_at']
+                    })
+                return timeseries_data
             
             def _delete_aspect_generic(self, entity_label: str, entity_urn: str, aspect_name: str) -> None:
                 """Generic method to delete an aspect"""
-                with self._driver.session() as s:
-                    s.run(
-                        f"""
-                        MATCH (e:{entity_label} {{urn:$urn}})-[r:HAS_ASPECT {{name:$an}}]->(a:Aspect)
-                        DELETE r, a
-                        """,
-                        urn=entity_urn, an=aspect_name
-                    )
+                self._run(
+                    f"""
+                    MATCH (e:{entity_label} {{urn:$urn}})-[r:HAS_ASPECT {{name:$an}}]->(a:Aspect)
+                    DELETE r, a
+                    """,
+                    urn=entity_urn, an=aspect_name
+                )
+            
+            def _prepare_aspect_call(self, aspect_name: str, entity_creation: Dict[str, Any]|None, entity_label: str|None,
+                                     entity_urn: str|None, payload: Dict[str, Any]|None, entity_params: Dict[str, Any]) -> tuple:
+                """Resolve the target entity and payload shared by the versioned and timeseries aspect methods"""
+                if entity_urn is None and entity_creation:
+                    entity_urn = self._create_entity_if_needed(entity_creation, entity_params)
+                    entity_label = entity_creation['entity_type']
+                elif entity_urn is None:
+                    raise ValueError(f"entity_urn is required for aspect {aspect_name}")
+                
+                # If payload is None, extract it from entity_params
+                if payload is None:
+                    payload = {prop: entity_params[prop] for prop in self._aspect_properties.get(aspect_name, ()) if prop in entity_params}
+                
+                return entity_label, entity_urn, payload
             
             def _create_entity_if_needed(self, entity_creation: Dict[str, Any], entity_params: Dict[str, Any]) -> str:
                 """Create entity if it doesn't exist and return its URN"""
@@ -423,41 +775,67 @@ class Neo4jWriterGenerator:
                 
                 return entity_urn
             
-            def _apply_relationship_rule_generic(self, entity_urn: str, entity_type: str, data: Dict[str, Any], rule: Dict[str, Any]):
+            def _apply_relationship_rule_generic(self, entity_urn: str, entity_type: str, data: Dict[str, Any], rule: Dict[str, Any],
+                                                 pending: Dict[tuple, List[Dict[str, Any]]]|None = None):
                 """Apply a single relationship rule to create relationships using generic configuration"""
                 rule_config = self.registry.get('relationship_rule_config', {})
-                relationship_type_field = rule_config.get('relationship_type_field', 'relationship_type')
-                source_entity_field = rule_config.get('source_entity_field', 'source_entity')
-                target_entity_field = rule_config.get('target_entity_field', 'target_entity')
-                direction_field = rule_config.get('direction_field', 'direction')
-                field_mapping_field = rule_config.get('field_mapping_field', 'field_mapping')
                 additional_relationships_field = rule_config.get('additional_relationships_field', 'additional_relationships')
                 
-                relationship_type = rule[relationship_type_field]
-                source_entity = rule[source_entity_field]
-                target_entity = rule[target_entity_field]
-                direction = rule.get(direction_field, rule_config.get('default_direction', 'outgoing'))
-                field_mapping = rule[field_mapping_field]
+                relationship_type = rule[rule_config.get('relationship_type_field', 'relationship_type')]
+                direction = rule.get(rule_config.get('direction_field', 'direction'), rule_config.get('default_direction', 'outgoing'))
+                field_mapping = rule[rule_config.get('field_mapping_field', 'field_mapping')]
                 
                 source_field = field_mapping[rule_config.get('source_field_name', 'source_field')]
-                target_field = field_mapping.get(rule_config.get('target_field_name', 'target_field'), rule_config.get('default_target_field', 'urn'))
+                source_entity_type = field_mapping[rule_config.get('source_entity_type_name', 'source_entity_type')]
+                target_entity_type = field_mapping[rule_config.get('target_entity_type_name', 'target_entity_type')]
+                
+                # Walk the rule configuration once; every field value reuses the same resolved spec
+                outgoing = direction == rule_config.get('outgoing_direction', 'outgoing')
+                if outgoing:
+                    resolve_entity_type = target_entity_type
+                    resolve_urn_field = field_mapping[rule_config.get('target_urn_field_name', 'target_urn_field')]
+                else:  # incoming
+                    resolve_entity_type = source_entity_type
+                    resolve_urn_field = field_mapping[rule_config.get('source_urn_field_name', 'source_urn_field')]
+                
+                # Relationship properties come from the data, not the field value
+                relationship_props = {
+                    prop_name: data[data_field]
+                    for prop_name, data_field in field_mapping.get('relationship_properties', {}).items()
+                    if data_field in data
+                }
+                spec = {
+                    'relationship_type': relationship_type,
+                    'outgoing': outgoing,
+                    'entity_type': resolve_entity_type,
+                    'urn_field': resolve_urn_field,
+                    'field_mapping': field_mapping,
+                    'props': relationship_props,
+                }
                 
                 # Generic field value extraction
                 field_values = self._extract_field_values_generic(source_field, data)
                 
+                # Resolve every value first so the rule is written with a single statement
+                rows = []
+                urn_cache = {}
                 for field_value in field_values:
                     if field_value:
-                        self._create_relationship_from_field_mapping_generic(
-                            entity_urn, entity_type, data, rule, field_value
-                        )
+                        row = self._create_relationship_from_field_mapping_generic(entity_urn, data, spec, field_value, urn_cache)
+                        if row:
+                            rows.append(row)
                 
-                # Handle additional relationships
-                additional_relationships = rule.get(additional_relationships_field, [])
-                for additional_rule in additional_relationships:
-                    self._create_additional_relationship_generic(entity_urn, entity_type, data, additional_rule)
+                # Defer the write so rules sharing a relationship shape go out together
+                with self._pending_relationships(pending) as pending:
+                    pending.setdefault((source_entity_type, relationship_type, target_entity_type), []).extend(rows)
+                    
+                    # Handle additional relationships in the same batch instead of one write each
+                    additional_relationships = rule.get(additional_relationships_field, [])
+                    for additional_rule in additional_relationships:
+                        self._create_additional_relationship_generic(entity_urn, entity_type, data, additional_rule, pending)
             
-            def _extract_field_values_generic(self, source_field: str, data: Dict[str, Any]) -> List[Any]:
-                """Generic field value extraction supporting arrays and direct fields"""
+            def _extract_field_values_generic(self, source_field: str, data: Dict[str, Any]) -> Iterator[Any]:
+                """Generic field value extraction supporting arrays and direct fields, yielded lazily"""
                 array_separator = '[]'
                 
                 if array_separator in source_field:
@@ -468,84 +846,88 @@ class Neo4jWriterGenerator:
                     array_data = data.get(base_field, [])
                     if not isinstance(array_data, list):
                         if isinstance(array_data, str) and ',' in array_data:
-                            array_data = [item.strip() for item in array_data.split(',') if item.strip()]
+                            array_data = (item.strip() for item in array_data.split(',') if item.strip())
                         elif array_data:
-                            array_data = [array_data]
+                            array_data = (array_data,)
                         else:
-                            array_data = []
+                            return
                     
-                    values = []
-                    for item in array_data:
-                        if sub_field:
-                            if isinstance(item, dict) and sub_field in item:
-                                values.append(item[sub_field])
-                        else:
-                            values.append(item)
-                    return values
+                    if sub_field:
+                        yield from (item[sub_field] for item in array_data if isinstance(item, dict) and sub_field in item)
+                    else:
+                        yield from array_data
                 else:
                     field_value = data.get(source_field)
                     if field_value is None:
-                        return []
+                        return
                     
                     # Handle comma-separated values generically
                     if isinstance(field_value, str) and ',' in field_value and not field_value.startswith('urn:'):
-                        return [v.strip() for v in field_value.split(",") if v.strip()]
+                        yield from (v.strip() for v in field_value.split(",") if v.strip())
                     else:
-                        return [field_value]
+                        yield field_value
             
-            def _create_relationship_from_field_mapping_generic(self, entity_urn: str, entity_type: str, data: Dict[str, Any], rule: Dict[str, Any], field_value: Any):
-                """Create a relationship based on generic field mapping rule"""
-                rule_config = self.registry.get('relationship_rule_config', {})
-                relationship_type_field = rule_config.get('relationship_type_field', 'relationship_type')
-                source_entity_field = rule_config.get('source_entity_field', 'source_entity')
-                target_entity_field = rule_config.get('target_entity_field', 'target_entity')
-                direction_field = rule_config.get('direction_field', 'direction')
-                field_mapping_field = rule_config.get('field_mapping_field', 'field_mapping')
-                
-                relationship_type = rule[relationship_type_field]
-                source_entity = rule[source_entity_field]
-                target_entity = rule[target_entity_field]
-                direction = rule.get(direction_field, rule_config.get('default_direction', 'outgoing'))
-                field_mapping = rule[field_mapping_field]
-                
-                source_entity_type = field_mapping[rule_config.get('source_entity_type_name', 'source_entity_type')]
-                target_entity_type = field_mapping[rule_config.get('target_entity_type_name', 'target_entity_type')]
-                source_urn_field = field_mapping[rule_config.get('source_urn_field_name', 'source_urn_field')]
-                target_urn_field = field_mapping[rule_config.get('target_urn_field_name', 'target_urn_field')]
-                
-                if direction == rule_config.get('outgoing_direction', 'outgoing'):
-                    source_urn = entity_urn
-                    target_urn = self._resolve_urn_generic(field_value, target_entity_type, target_urn_field, data, field_mapping, entity_urn)
+            def _create_relationship_from_field_mapping_generic(self, entity_urn: str, data: Dict[str, Any], spec: Dict[str, Any], field_value: Any,
+                                                                urn_cache: Dict[Any, str]|None = None) -> Dict[str, Any]|None:
+                """Resolve the relationship row for a field value from a rule spec built by _apply_relationship_rule_generic"""
+                resolved_urn = self._resolve_urn_generic(field_value, spec['entity_type'], spec['urn_field'], data,
+                                                         spec['field_mapping'], entity_urn, urn_cache)
+                if spec['outgoing']:
+                    source_urn, target_urn = entity_urn, resolved_urn
                 else:  # incoming
-                    source_urn = self._resolve_urn_generic(field_value, source_entity_type, source_urn_field, data, field_mapping, entity_urn)
-                    target_urn = entity_urn
+                    source_urn, target_urn = resolved_urn, entity_urn
                 
                 if source_urn and target_urn:
                     # Prevent self-relationships
                     if source_urn == target_urn:
-                        print(f"   ⚠️ Skipped self-relationship: {source_urn} -> {relationship_type} -> {target_urn}")
-                        return
+                        self.logger.debug("Skipped self-relationship", relationship_type=spec['relationship_type'], urn=source_urn)
+                        return None
                     
-                    # Extract relationship properties from data if specified
-                    relationship_props = {}
-                    if 'relationship_properties' in field_mapping:
-                        for prop_name, data_field in field_mapping['relationship_properties'].items():
-                            if data_field in data:
-                                relationship_props[prop_name] = data[data_field]
-                    
-                    # Check if relationship already exists to prevent duplicates
-                    with self._driver.session() as s:
-                        result = s.run(
-                            f"MATCH (a:{source_entity_type} {{urn: $source_urn}})-[r:{relationship_type}]->(b:{target_entity_type} {{urn: $target_urn}}) RETURN r",
-                            source_urn=source_urn, target_urn=target_urn
-                        )
-                        if not result.single():
-                            self._create_relationship_generic(source_entity_type, source_urn, relationship_type, target_entity_type, target_urn, relationship_props)
-                else:
-                    print(f"   ⚠️ Skipped {relationship_type}: source_urn={source_urn}, target_urn={target_urn}")
+                    return {'source_urn': source_urn, 'target_urn': target_urn, 'props': spec['props']}
+                
+                self.logger.warning(f"Skipped {spec['relationship_type']}: unresolved URN", source_urn=source_urn, target_urn=target_urn)
+                return None
+            
+            @contextmanager
+            def _pending_relationships(self, pending: Dict[tuple, List[Dict[str, Any]]]|None = None) -> Iterator[Dict[tuple, List[Dict[str, Any]]]]:
+                """Yield the caller's pending relationship map, or a fresh one that is flushed on exit"""
+                if pending is not None:
+                    yield pending
+                    return
+                pending = {}
+                yield pending
+                self._flush_relationships_generic(pending)
+            
+            def _flush_relationships_generic(self, pending: Dict[tuple, List[Dict[str, Any]]]) -> None:
+                """Write relationship rows collected across rules, one statement per relationship shape"""
+                for (from_label, rel, to_label), rows in pending.items():
+                    self._merge_relationships_generic(from_label, rel, to_label, rows)
             
-            def _create_additional_relationship_generic(self, entity_urn: str, entity_type: str, data: Dict[str, Any], rule: Dict[str, Any]):
-                """Create additional relationships using generic configuration"""
+            def _merge_relationships_generic(self, from_label: str, rel: str, to_label: str, rows: List[Dict[str, Any]]) -> None:
+                """Create missing relationships for all rows, BATCH_SIZE rows per statement"""
+                if not rows:
+                    return
+                # Only the first row of a repeated pair could create the relationship, so drop the rest
+                unique_rows = {}
+                for row in rows:
+                    unique_rows.setdefault((row['source_urn'], row['target_urn']), row)
+                rows = list(unique_rows.values())
+                # ON CREATE keeps existing relationships untouched, as the per-row existence check did
+                query = f"""
+                    UNWIND $rows AS row
+                    MATCH (a:{from_label} {{urn:row.source_urn}})
+                    MATCH (b:{to_label} {{urn:row.target_urn}})
+                    MERGE (a)-[r:{rel}]->(b)
+                    ON CREATE SET r += row.props
+                    """
+                with self.session():
+                    for start in range(0, len(rows), BATCH_SIZE):
+                        chunk = rows[start:start + BATCH_SIZE]
+                        self._execute_write(lambda tx: tx.run(query, rows=chunk).consume())
+            
+            def _create_additional_relationship_generic(self, entity_urn: str, entity_type: str, data: Dict[str, Any], rule: Dict[str, Any],
+                                                        pending: Dict[tuple, List[Dict[str, Any]]]|None = None):
+                """Create additional relationships using generic configuration, or queue them in pending"""
                 rule_config = self.registry.get('relationship_rule_config', {})
                 relationship_type_field = rule_config.get('relationship_type_field', 'relationship_type')
                 source_entity_field = rule_config.get('source_entity_field', 'source_entity')
@@ -566,40 +948,33 @@ class Neo4jWriterGenerator:
                 target_urn = data.get(target_field)
                 
                 if source_urn and target_urn:
-                    self._create_relationship_generic(source_entity, source_urn, relationship_type, target_entity, target_urn, {})
+                    # Even a lone relationship goes through the batched UNWIND statement shared by every rule
+                    with self._pending_relationships(pending) as pending:
+                        pending.setdefault((source_entity, relationship_type, target_entity), []).append(
+                            {'source_urn': source_urn, 'target_urn': target_urn, 'props': {}}
+                        )
             
             def _resolve_urn_generic(self, field_value: Any, entity_type: str, urn_field: str, 
-                                   data: Dict[str, Any], field_mapping: Dict[str, Any], entity_urn: str = None) -> str:
+                                   data: Dict[str, Any], field_mapping: Dict[str, Any], entity_urn: str = None,
+                                   cache: Dict[Any, str]|None = None) -> str:
                 """Generic URN resolution using configuration"""
                 
                 # If field_value is already a complete URN, return it as-is
                 if isinstance(field_value, str) and field_value.startswith('urn:'):
                     return field_value
                 
-                # Get entity definition from registry
-                entity_def = self.registry.get('entities', {}).get(entity_type)
-                if not entity_def:
-                    return field_value
+                # Repeated values within one rule resolve to the same URN
+                if cache is not None and isinstance(field_value, (str, int)):
+                    key = (entity_type, urn_field, field_value)
+                    if key not in cache:
+                        cache[key] = self._resolve_urn_generic(field_value, entity_type, urn_field, data, field_mapping, entity_urn)
+                    return cache[key]
                 
-                # Get URN pattern configuration
-                urn_generator_name = entity_def.get('urn_generator')
-                urn_pattern = self.registry.get('urn_patterns', {}).get(urn_generator_name)
-                if not urn_pattern:
+                # One dict lookup picks the strategy bound for this entity type when the writer was built
+                resolver = self._urn_resolvers.get(entity_type)
+                if resolver is None:
                     return field_value
-                
-                # Use configuration-driven resolution
-                resolution_strategy = urn_pattern.get('resolution_strategy', 'template')
-                
-                if resolution_strategy == 'direct':
-                    result = self._resolve_direct_urn(field_value, entity_type, urn_pattern, entity_urn)
-                elif resolution_strategy == 'template':
-                    result = self._resolve_template_urn(field_value, entity_type, urn_pattern, data, entity_urn)
-                elif resolution_strategy == 'lookup':
-                    result = self._resolve_lookup_urn(field_value, entity_type, urn_field, data)
-                else:
-                    result = field_value
-                
-                return result
+                return resolver(field_value, urn_field, data, entity_urn)
             
             def _resolve_direct_urn(self, field_value: Any, entity_type: str, urn_pattern: Dict[str, Any], entity_urn: str = None) -> str:
                 """Resolve URN using direct construction strategy"""
@@ -635,18 +1010,15 @@ class Neo4jWriterGenerator:
                     pattern_params = urn_pattern.get('parameters', [])
                     
                     # Map field_value to the appropriate parameter based on entity type
-                    if entity_type == 'CorpUser':
-                        urn_params['username'] = field_value
-                    elif entity_type == 'CorpGroup':
-                        urn_params['name'] = field_value
-                    elif entity_type == 'Column':
-                        urn_params['field_path'] = field_value
-                        if entity_urn:
-                            urn_params['dataset_urn'] = entity_urn
-                    else:
+                    value_param = _TEMPLATE_VALUE_PARAMS.get(entity_type)
+                    if value_param:
+                        urn_params[value_param] = field_value
+                        parent_param = _TEMPLATE_PARENT_PARAMS.get(entity_type)
+                        if parent_param and entity_urn:
+                            urn_params[parent_param] = entity_urn
+                    elif pattern_params:
                         # Default mapping for other entity types
-                        if pattern_params and len(pattern_params) > 0:
-                            urn_params[pattern_params[0]] = field_value
+                        urn_params[pattern_params[0]] = field_value
                     
                     # Add any additional parameters from data that match the pattern parameters
                     for param in pattern_params:
@@ -656,7 +1028,7 @@ class Neo4jWriterGenerator:
                     try:
                         return urn_generator(**urn_params)
                     except Exception as e:
-                        print(f"   ⚠️ URN generation failed for {entity_type}: {e}")
+                        self.logger.warning(f"URN generation failed for {entity_type}: {e}")
                         return field_value
                 
                 return field_value
@@ -666,17 +1038,16 @@ class Neo4jWriterGenerator:
                 rule_config = self.registry.get('relationship_rule_config', {})
                 
                 if urn_field != rule_config.get('urn_field_name', 'urn'):
-                    with self._driver.session() as s:
-                        result = s.run(
-                            f"MATCH (e:{entity_type} {{{urn_field}: $value}}) WHERE e.urn IS NOT NULL RETURN e.urn as urn ORDER BY e.urn LIMIT 1",
-                            value=field_value
-                        )
-                        record = result.single()
-                        if record and record['urn']:
-                            return record['urn']
-                        else:
-                            print(f"   ⚠️ Could not find {entity_type} with {urn_field}={field_value}")
-                            return None
+                    records = self._run(
+                        f"MATCH (e:{entity_type} {{{urn_field}: $value}}) WHERE e.urn IS NOT NULL RETURN e.urn as urn ORDER BY e.urn LIMIT 1",
+                        value=field_value, read=True
+                    )
+                    record = records[0] if records else None
+                    if record and record['urn']:
+                        return record['urn']
+                    else:
+                        self.logger.warning(f"Could not find {entity_type} with {urn_field}={field_value}")
+                        return None
                 
                 return field_value
             
@@ -684,7 +1055,7 @@ class Neo4jWriterGenerator:
                 """Ensure target entity exists using generic property extraction"""
                 entity_def = self.registry.get('entities', {}).get(entity_type)
                 if not entity_def:
-                    print(f"   ⚠️ Entity type '{entity_type}' not found in registry")
+                    self.logger.warning(f"Entity type '{entity_type}' not found in registry")
                     return
                 
                 # Extract properties using configuration-driven parsing
@@ -3,15 +3,18 @@
 Entry point script for CLI generation
 """
 
+import compileall
 import os
 import sys
 from pathlib import Path
 
-# Add the package root to the path for imports
-package_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(package_root))
-
-from yaml2graph.cli_generator.generator import CLIGenerator
+try:
+    from yaml2graph.cli_generator import generator as generator_module
+except ImportError:
+    # Fallback for running the file directly from a source checkout
+    sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+    from yaml2graph.cli_generator import generator as generator_module
+from yaml2graph.scripts.stamp import STAMP_FILE, is_up_to_date, registry_digest, write_stamp
 
 
 def main():
@@ -24,12 +27,22 @@ def main():
     print(f"📂 Registry: {registry_path}")
     print(f"📁 Output: {output_dir}")
     
+    # Skip regeneration when neither the registry nor the generator changed
+    digest = registry_digest(registry_path, [generator_module.__file__])
+    if is_up_to_date(output_dir, digest):
+        print(f"\n✅ {output_dir} is up to date (delete {STAMP_FILE} to force regeneration)")
+        return
+    
     # Create generator
-    generator = CLIGenerator(registry_path, output_dir)
+    generator = generator_module.CLIGenerator(registry_path, output_dir)
     
     # Generate all files
     generator.generate_all()
     
+    # Precompile the generated modules so the first start does not pay for it
+    compileall.compile_dir(output_dir, quiet=1, workers=0)
+    write_stamp(output_dir, digest)
+    
     print(f"\n✅ CLI generation complete!")
     print(f"📁 Files generated in: {output_dir}")
     print(f"\n🚀 To run the CLI:")
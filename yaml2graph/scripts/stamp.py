@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Registry stamp helpers that let the generation scripts skip unchanged output
+"""
+
+import hashlib
+from importlib import metadata
+from pathlib import Path
+from typing import Iterable, List
+
+import yaml
+
+STAMP_FILE = ".registry.sha256"
+# Generated code is shaped by the registry package (writers, loaders, generators) and the utils it imports
+PACKAGE_ROOT = Path(__file__).resolve().parent.parent
+PACKAGE_SOURCE_DIRS = ("registry", "utils")
+
+
+def _package_version() -> str:
+    """Installed yaml2graph version, or 'unknown' when running from an uninstalled checkout"""
+    try:
+        return metadata.version("yaml2graph")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def _include_paths(registry_path: str) -> List[Path]:
+    """Resolve the registry's includes the way RegistryLoader does, skipping any that cannot be found"""
+    with open(registry_path, "rb") as f:
+        includes = (yaml.safe_load(f) or {}).get("includes", [])
+    registry_dir = Path(registry_path).parent
+    paths = []
+    for include in includes:
+        for candidate in (registry_dir / include, Path(include), PACKAGE_ROOT / "config" / Path(include).name):
+            if candidate.exists():
+                paths.append(candidate)
+                break
+    return paths
+
+
+def registry_digest(registry_path: str, sources: Iterable[str]) -> str:
+    """Hash the registry YAMLs and includes, the package sources and version, plus the given generator sources"""
+    digest = hashlib.sha256(_package_version().encode())
+    config_files = {p.resolve() for p in Path(registry_path).parent.glob("*.yaml")}
+    config_files.update(p.resolve() for p in _include_paths(registry_path))
+    package_files = sorted(p for d in PACKAGE_SOURCE_DIRS for p in (PACKAGE_ROOT / d).glob("*.py"))
+    for path in [*sorted(config_files), *package_files, *map(Path, sources)]:
+        digest.update(str(path.relative_to(PACKAGE_ROOT) if PACKAGE_ROOT in path.parents else path.name).encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def is_up_to_date(output_dir: str, digest: str) -> bool:
+    """Check whether output_dir was generated from the same registry and generator"""
+    stamp = Path(output_dir) / STAMP_FILE
+    return stamp.exists() and stamp.read_text().strip() == digest
+
+
+def write_stamp(output_dir: str, digest: str) -> None:
+    """Record the digest the output_dir was generated from"""
+    (Path(output_dir) / STAMP_FILE).write_text(digest)
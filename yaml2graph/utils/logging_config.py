@@ -19,6 +19,10 @@ import json
 from datetime import datetime
 
 
+# Rotating file handlers keyed by resolved log file path, shared by every logger in the process
+_FILE_HANDLERS: Dict[str, logging.handlers.RotatingFileHandler] = {}
+
+
 class ColoredFormatter(logging.Formatter):
     """Custom formatter with color support for console output."""
     
@@ -33,11 +37,14 @@ class ColoredFormatter(logging.Formatter):
     }
     
     def format(self, record):
-        # Add color to the level name
-        if hasattr(record, 'levelname') and record.levelname in self.COLORS:
-            record.levelname = f"{self.COLORS[record.levelname]}{record.levelname}{self.COLORS['RESET']}"
-        
-        return super().format(record)
+        # Add color to the level name, restoring it so other handlers (e.g. the JSON file) see the plain name
+        levelname = record.levelname
+        if levelname in self.COLORS:
+            record.levelname = f"{self.COLORS[levelname]}{levelname}{self.COLORS['RESET']}"
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = levelname
 
 
 class JSONFormatter(logging.Formatter):
@@ -61,7 +68,8 @@ class JSONFormatter(logging.Formatter):
         if hasattr(record, 'extra_fields'):
             log_entry.update(record.extra_fields)
         
-        return json.dumps(log_entry)
+        # Stringify non-JSON values (e.g. datetimes, writer results) instead of failing the record
+        return json.dumps(log_entry, default=str)
 
 
 class LineAgenticLogger:
@@ -108,17 +116,23 @@ class LineAgenticLogger:
             log_path = Path(self.log_file)
             log_path.parent.mkdir(parents=True, exist_ok=True)
             
-            # Use rotating file handler
-            file_handler = logging.handlers.RotatingFileHandler(
-                self.log_file,
-                maxBytes=10*1024*1024,  # 10MB
-                backupCount=5
-            )
-            file_handler.setLevel(self.log_level)
-            
-            # Use JSON formatter for file output
-            file_formatter = JSONFormatter()
-            file_handler.setFormatter(file_formatter)
+            # Every logger writing to the same file shares one rotating handler (one open stream, one rotation)
+            file_handler = _FILE_HANDLERS.get(str(log_path.resolve()))
+            if file_handler is None:
+                # delay=True opens the file on the first record instead of at logger creation
+                file_handler = logging.handlers.RotatingFileHandler(
+                    self.log_file,
+                    maxBytes=10*1024*1024,  # 10MB
+                    backupCount=5,
+                    delay=True
+                )
+                # Shared across loggers of different levels, so filtering is left to each logger's own level
+                file_handler.setLevel(logging.NOTSET)
+                
+                # Use JSON formatter for file output
+                file_formatter = JSONFormatter()
+                file_handler.setFormatter(file_formatter)
+                _FILE_HANDLERS[str(log_path.resolve())] = file_handler
             self.logger.addHandler(file_handler)
     
     def debug(self, message: str, **kwargs):
@@ -147,6 +161,9 @@ class LineAgenticLogger:
     
     def _log_with_extra(self, level: int, message: str, **kwargs):
         """Log message with extra fields."""
+        # Disabled levels return before a record (and its extra fields) is built
+        if not self.logger.isEnabledFor(level):
+            return
         if kwargs:
             # Create a custom record with extra fields
             record = logging.LogRecord(